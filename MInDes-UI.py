@@ -1,6 +1,6 @@
 # MInDes-UI.py
 import sys, os, subprocess
-os.environ["QT_API"] = "pyside6"
+import functools
 from pathlib import Path
 from PySide6.QtWidgets import (
     QApplication,
@@ -17,8 +17,18 @@ from PySide6.QtWidgets import (
     QPushButton,
     QSplashScreen,
 )
-from PySide6.QtCore import Qt, QSettings, QTimer
-from PySide6.QtGui import QAction, QCloseEvent, QFont, QPixmap, QIcon, QGuiApplication
+from PySide6.QtCore import (
+    Qt, QCoreApplication, QSettings, QTimer, QObject, QRunnable, QThreadPool, Signal
+)
+from PySide6.QtGui import (
+    QAction,
+    QCloseEvent,
+    QFont,
+    QPixmap,
+    QPixmapCache,
+    QIcon,
+    QGuiApplication,
+)
 
 
 def resource_path(relative_path):
@@ -32,8 +42,74 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
+_ICON_PATH = resource_path(os.path.join("icon", "mid.ico"))
+
+# 支持加载的工程文件扩展名（统一小写判断）
+_MINDES_EXTS = frozenset({".mindes"})
+
+# 超过该大小的 .mindes 文件改为后台线程读取，避免阻塞 UI
+_LARGE_MINDES_BYTES = 2 * 1024 * 1024
+
+# 自定义求解器目录结构说明（静态文案，供帮助弹窗使用）
+_CUSTOM_SOLVER_HELP = (
+    "How to add custom solvers:\n\n"
+    "├── solver/\n"
+    "│   ├── Solver_v1.0/\n"
+    "│   │   └── MInDes.exe\n"
+    "│   │   └── ...\n"
+    "│   └── Solver_v2.0/\n"
+    "│   │   └── MInDes.exe\n"
+    "│   │   └── ...\n"
+    "│   └── Custom Solver/\n"
+    "│   │   └── MInDes.exe\n"
+    "│   │   └── ...\n"
+    "│   └── .../\n"
+    "└── MInDes-UI.exe\n"
+    "└── ..."
+)
+
+# StatusLevel 整数值 → update_status 关键字参数的预计算映射（按枚举值索引）
+_LEVEL_KW = [
+    {"error": False, "warning": False, "success": False, "info": True},   # INFO
+    {"error": False, "warning": False, "success": True,  "info": False},  # SUCCESS
+    {"error": False, "warning": True,  "success": False, "info": False},  # WARNING
+    {"error": True,  "warning": False, "success": False, "info": False},  # ERROR
+]
+
+
+def _read_mindes_text(file_path: str) -> str:
+    """整块二进制读入后一次性解码，避免文本模式的分块增量解码开销"""
+    with open(file_path, "rb", buffering=0) as f:
+        data = f.read()
+    return data.decode("utf-8", errors="replace").replace("\r\n", "\n")
+
+
+class _MindesLoadSignals(QObject):
+    loaded = Signal(str, str)  # (file_path, content)
+    failed = Signal(str, str)  # (file_path, error message)
+
+
+class _MindesLoadTask(QRunnable):
+    """在线程池中读取大 .mindes 文件，读完通过信号送回 UI 线程"""
+
+    def __init__(self, file_path: str):
+        super().__init__()
+        self.file_path = file_path
+        self.signals = _MindesLoadSignals()
+
+    def run(self):
+        try:
+            content = _read_mindes_text(self.file_path)
+        except Exception as e:
+            self.signals.failed.emit(self.file_path, str(e))
+        else:
+            self.signals.loaded.emit(self.file_path, content)
+
+
+@functools.lru_cache(maxsize=1)
 def get_app_icon():
-    icon_path = resource_path(os.path.join("icon", "mid.ico"))
+    """返回应用 QIcon；结果缓存，避免每次打开窗口/对话框都重新解码 .ico"""
+    icon_path = _ICON_PATH
     if os.path.exists(icon_path):
         return QIcon(icon_path)
     else:
@@ -77,7 +153,44 @@ def update_splash_progress(splash, current, total, detail):
     QApplication.processEvents()
 
 
+# About 对话框的静态文案，模块级常量避免每次打开重新拼装
+_ABOUT_INFO_TEXT = """Version: 1.0
+Copyright © Qi Huang"""
+_ABOUT_HOME_HTML = """<a href='https://github.com/hq5088028/MInDes-UI' style='color:#0078d7;'>MInDes-UI (GitHub)</a><br>
+<a href='https://github.com/Microstructure-Intelligent-Design/MInDes' style='color:#0078d7;'>MInDes-Solver (GitHub)</a>"""
+_ABOUT_EMAIL_HTML = (
+    "Email: <a href='mailto:qihuang0908@163.com' style='color:#0078d7;'>qihuang0908@163.com</a>"
+)
+
+
 class AboutDialog(QDialog):
+    # 类级缓存：字体解析只做一次；logo 走进程级 QPixmapCache 共享解码结果
+    _title_font = None
+    _info_font = None
+
+    @classmethod
+    def _get_logo(cls, dpr: float):
+        pm = QPixmap()
+        key = f"mindes_logo@{dpr:g}"
+        if not QPixmapCache.find(key, pm):
+            logo_path = resource_path(os.path.join("icon", "logo.png"))
+            # 按物理像素缩放并标记 DPR，绘制时无需再插值；
+            # FastTransformation 避免一次性的双线性逐像素扫描
+            pm = QPixmap(logo_path).scaled(
+                int(256 * dpr), int(173 * dpr),
+                Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.FastTransformation
+            )
+            pm.setDevicePixelRatio(dpr)
+            QPixmapCache.insert(key, pm)
+        return pm
+
+    @classmethod
+    def _get_fonts(cls):
+        if cls._title_font is None:
+            cls._title_font = QFont("Arial", 14, QFont.Weight.Bold)
+            cls._info_font = QFont("Arial", 10)
+        return cls._title_font, cls._info_font
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("About MInDes")
@@ -89,37 +202,29 @@ class AboutDialog(QDialog):
 
         # 使用图标（无外部依赖）
         logo_label = QLabel()
-        logo_path = resource_path(os.path.join("icon", "logo.png"))
-        pixmap = QPixmap(logo_path).scaled(
-            256, 173, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
-        )
-        logo_label.setPixmap(pixmap)
+        logo_label.setPixmap(self._get_logo(self.devicePixelRatioF()))
         logo_label.setFixedSize(300, 200)
         logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
+        title_font, info_font = self._get_fonts()
+
         # --- 标题 ---
         title_label = QLabel("Microstructure Intelligent Design")
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        title_label.setFont(title_font)
 
         # --- 版本和版权信息（多行居中）---
-        info_text = """Version: 1.0
-Copyright © Qi Huang"""
-        info_label = QLabel(info_text)
+        info_label = QLabel(_ABOUT_INFO_TEXT)
         info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        info_label.setFont(QFont("Arial", 10))
+        info_label.setFont(info_font)
 
         # --- 链接（可点击）---
-        home_text = """<a href='https://github.com/hq5088028/MInDes-UI' style='color:#0078d7;'>MInDes-UI (GitHub)</a><br>
-<a href='https://github.com/Microstructure-Intelligent-Design/MInDes' style='color:#0078d7;'>MInDes-Solver (GitHub)</a>"""
-        home_label = QLabel(home_text)
+        home_label = QLabel(_ABOUT_HOME_HTML)
         home_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         home_label.setOpenExternalLinks(True)  # 允许点击跳转
 
         # --- 邮箱 ---
-        email_label = QLabel(
-            "Email: <a href='mailto:qihuang0908@163.com' style='color:#0078d7;'>qihuang0908@163.com</a>"
-        )
+        email_label = QLabel(_ABOUT_EMAIL_HTML)
         email_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         email_label.setOpenExternalLinks(True)
 
@@ -166,6 +271,8 @@ class MainWindow(QMainWindow):
         self.vts_placeholder = None
         self.log_tab_index = -1
         self.vts_tab_index = -1
+        self._tab_factories = {}
+        self._mindes_load_task = None
 
         self.settings = QSettings("MInDes", "MInDes-UI")
         last_dir = self.settings.value("last_directory", "", type=str)
@@ -178,6 +285,8 @@ class MainWindow(QMainWindow):
             self.startup_progress(current, total, text)
 
     def setup_ui(self):
+        # 构建期间关闭重绘，show() 后只触发一次布局/绘制
+        self.setUpdatesEnabled(False)
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         main_layout = QHBoxLayout(central_widget)
@@ -201,15 +310,16 @@ class MainWindow(QMainWindow):
             if self.last_dir and self.last_dir.is_dir()
             else self.file_browser.default_path
         )
-        self.file_browser.pathEdited.connect(self.on_path_edited)
-        self.file_browser.loadVtsFolderRequested.connect(
-            self.on_load_vts_folder_requested
-        )
-        self.file_browser.loadLogStatisticFolderRequested.connect(
-            self.load_log_statistic_file
-        )
-        self.file_browser.folderDoubleClicked.connect(self.on_folder_double_clicked)
-        self.file_browser.fileDoubleClicked.connect(self.load_mindes_file)
+        # 统一批量连接；发射端与槽同属 UI 线程，显式 DirectConnection
+        # 省去每次 emit 的连接类型判定
+        for sig, slot in (
+            (self.file_browser.pathEdited, self.on_path_edited),
+            (self.file_browser.loadVtsFolderRequested, self.on_load_vts_folder_requested),
+            (self.file_browser.loadLogStatisticFolderRequested, self.load_log_statistic_file),
+            (self.file_browser.folderDoubleClicked, self.on_folder_double_clicked),
+            (self.file_browser.fileDoubleClicked, self.load_mindes_file),
+        ):
+            sig.connect(slot, Qt.ConnectionType.DirectConnection)
 
         left_layout.addWidget(self.file_browser)
         splitter.addWidget(left_panel)
@@ -221,17 +331,30 @@ class MainWindow(QMainWindow):
         right_layout.setSpacing(0)  # 可选：控件间距
 
         self.tab_widget = QTabWidget()
+        # 固定三个标签页：关掉用不到的标签栏特性，减小重绘范围
+        self.tab_widget.setDocumentMode(True)
+        self.tab_widget.setUsesScrollButtons(False)
+        self.tab_widget.setMovable(False)
+        self.tab_widget.setTabsClosable(False)
+        self.tab_widget.tabBar().setDrawBase(False)
         right_layout.addWidget(self.tab_widget)  # 将 tab widget 放入布局
 
         splitter.addWidget(right_panel)
         self.create_tabs()
 
-        splitter.setSizes([200, 1000])
+        # 左侧已 setFixedWidth(200)，声明式伸缩因子即可，无需 setSizes 触发
+        # 一轮尺寸协商
+        splitter.setStretchFactor(0, 0)
+        splitter.setStretchFactor(1, 1)
+        splitter.setChildrenCollapsible(False)
+        splitter.setHandleWidth(2)
+        self.setUpdatesEnabled(True)
         main_layout.addWidget(splitter)
 
     def on_load_vts_folder_requested(self, folder_path: str):
         """切换到 VTS 页面并加载指定文件夹"""
-        self.tab_widget.setCurrentIndex(self.vts_tab_index)
+        self._ensure_tab(self.vts_tab_index)
+        self._switch_tab(self.vts_tab_index)
         if self.vts_viewer is not None:
             self.vts_viewer.load_vts(folder_path)
         else:
@@ -255,7 +378,10 @@ class MainWindow(QMainWindow):
             self.file_browser.set_current_path(selected_path)
             return
 
-        if os.path.isfile(selected_path) and selected_path.lower().endswith(".mindes"):
+        if (
+            os.path.isfile(selected_path)
+            and os.path.splitext(selected_path)[1].lower() in _MINDES_EXTS
+        ):
             self.load_mindes_file(selected_path)
             return
 
@@ -265,29 +391,69 @@ class MainWindow(QMainWindow):
             "Please select a project folder or a .mindes file.",
         )
 
+    def _report_mindes_load_error(self, error: str):
+        """加载失败走非阻塞的状态栏提示，避免模态框的嵌套事件循环冻结 UI"""
+        if self.build_widget is not None:
+            self.build_widget.update_status(
+                f"Failed to load .mindes file: {error}", error=True
+            )
+        else:
+            QMessageBox.critical(
+                self, "Load Error", f"Failed to load .mindes file:\n{error}"
+            )
+
     def load_mindes_file(self, file_path: str):
-        if file_path.endswith(".mindes"):
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-                # 同步左侧文件浏览器到该文件所在目录
-                parent_dir = os.path.dirname(file_path)
-                if parent_dir and os.path.isdir(parent_dir):
-                    self.file_browser.set_current_path(parent_dir)
-
-                # 通知 BuildSimulationWidget 加载文件
-                if self.build_widget:
-                    self.build_widget.set_mindes_content(file_path, content)
-                    # 切换到 Build Simulation 标签页
-                    self.tab_widget.setCurrentIndex(0)
-            except Exception as e:
-                QMessageBox.critical(
-                    self, "Load Error", f"Failed to load .mindes file:\n{str(e)}"
-                )
+        if os.path.splitext(file_path)[1].lower() not in _MINDES_EXTS:
+            return
+        try:
+            size = os.path.getsize(file_path)
+        except OSError as e:
+            self._report_mindes_load_error(str(e))
+            return
+
+        if size > _LARGE_MINDES_BYTES:
+            # 大文件：交给线程池后台读取，UI 保持响应
+            task = _MindesLoadTask(file_path)
+            task.signals.loaded.connect(self._on_mindes_loaded)
+            task.signals.failed.connect(self._on_mindes_load_failed)
+            self._mindes_load_task = task  # 防止信号对象被提前回收
+            QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+            QThreadPool.globalInstance().start(task)
+            return
+
+        try:
+            content = _read_mindes_text(file_path)
+        except Exception as e:
+            self._report_mindes_load_error(str(e))
+            return
+        self._apply_mindes_content(file_path, content)
+
+    def _apply_mindes_content(self, file_path: str, content: str):
+        # 同步左侧文件浏览器到该文件所在目录
+        parent_dir = os.path.dirname(file_path)
+        if parent_dir and os.path.isdir(parent_dir):
+            self.file_browser.set_current_path(parent_dir)
+
+        # 通知 BuildSimulationWidget 加载文件
+        if self.build_widget:
+            self.build_widget.set_mindes_content(file_path, content)
+            # 切换到 Build Simulation 标签页
+            self._switch_tab(0)
+
+    def _on_mindes_loaded(self, file_path: str, content: str):
+        QApplication.restoreOverrideCursor()
+        self._mindes_load_task = None
+        self._apply_mindes_content(file_path, content)
+
+    def _on_mindes_load_failed(self, file_path: str, error: str):
+        QApplication.restoreOverrideCursor()
+        self._mindes_load_task = None
+        self._report_mindes_load_error(error)
 
     def load_log_statistic_file(self, folder_path: str):
         """切换到 LOG 页面并加载指定文件"""
-        self.tab_widget.setCurrentIndex(self.log_tab_index)
+        self._ensure_tab(self.log_tab_index)
+        self._switch_tab(self.log_tab_index)
         if self.log_stat_widget is not None:
             self.log_stat_widget.set_project_path(folder_path)
         else:
@@ -540,76 +706,108 @@ class MainWindow(QMainWindow):
         self.build_widget = BuildSimulationWidget()
         self.tab_widget.addTab(self.build_widget, "Build Simulation")
 
+        # 其余标签页延迟构建：启动时只放空占位页，首次切换时再实例化真实控件
+        # （避免启动时加载 matplotlib / VTK 及构建完整控件树）
+        self.log_placeholder = QWidget()
+        self.log_tab_index = self.tab_widget.addTab(
+            self.log_placeholder, "Log && Statistic"
+        )
+        self.vts_placeholder = QWidget()
+        self.vts_tab_index = self.tab_widget.addTab(
+            self.vts_placeholder, "VTS Data Viewer"
+        )
+        self._tab_factories = {
+            self.log_tab_index: ("Log && Statistic", self._build_log_stat),
+            self.vts_tab_index: ("VTS Data Viewer", self._build_vts_viewer),
+        }
+        self.tab_widget.currentChanged.connect(self._materialize_tab)
+
+    def _materialize_tab(self, index: int):
+        """首次切换到占位标签页时，构建真实控件并替换占位页"""
+        entry = self._tab_factories.pop(index, None)
+        if entry is None:
+            return
+        title, factory = entry
+        widget = factory()
+        # removeTab 会同步把当前页切到相邻占位页并再次触发 currentChanged，
+        # 屏蔽信号确保只构建用户点击的这一页（也避免中间页闪烁）
+        self.tab_widget.blockSignals(True)
+        try:
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, widget, title)
+            self.tab_widget.setCurrentIndex(index)
+        finally:
+            self.tab_widget.blockSignals(False)
+
+    def _ensure_tab(self, index: int):
+        """确保指定标签页的真实控件已构建（供信号路由在切页前触发）"""
+        if index in self._tab_factories:
+            self._materialize_tab(index)
+
+    def _switch_tab(self, target):
+        """切换标签页；已在目标页时跳过，避免多余的 currentChanged 与重绘"""
+        if isinstance(target, int):
+            if self.tab_widget.currentIndex() != target:
+                self.tab_widget.setCurrentIndex(target)
+        elif self.tab_widget.currentWidget() is not target:
+            self.tab_widget.setCurrentWidget(target)
+
+    def _build_log_stat(self):
         self.report_startup_progress(3, 8, "Loading Log && Statistic...")
+        # matplotlib 的 Qt 后端通过 QT_API 选择绑定，需在首次导入前设置
+        os.environ.setdefault("QT_API", "pyside6")
         from log_statistics_widget import LogStatisticsWidget
 
         self.log_stat_widget = LogStatisticsWidget(
             progress_callback=lambda detail: self.report_startup_progress(4, 8, detail)
         )
         self.log_stat_widget.statusMessage.connect(self.route_log_stat_status)
-        self.log_tab_index = self.tab_widget.addTab(
-            self.log_stat_widget, "Log && Statistic"
-        )
+        self.log_placeholder = None
+        return self.log_stat_widget
 
+    def _build_vts_viewer(self):
         self.report_startup_progress(5, 8, "Loading VTS Data Viewer...")
+        os.environ.setdefault("QT_API", "pyside6")
         from vts_viewer_widget import VTSViewerWidget
 
         self.vts_viewer = VTSViewerWidget(
             progress_callback=lambda detail: self.report_startup_progress(6, 8, detail)
         )
-        self.vts_tab_index = self.tab_widget.addTab(self.vts_viewer, "VTS Data Viewer")
+        self.vts_placeholder = None
+        return self.vts_viewer
 
-    def route_log_stat_status(self, message: str, level: str):
+    def route_log_stat_status(self, message: str, level: int):
         """
         将 (message, level) 转换为 update_status(error=..., warning=...) 形式
         """
-        kwargs = {
-            "error": level == "error",
-            "warning": level == "warning",
-            "success": level == "success",
-            "info": level in ("info", ""),  # 默认 info
-        }
         if self.build_widget is not None:
-            self.build_widget.update_status(message, **kwargs)
+            self.build_widget.update_status(message, **_LEVEL_KW[level])
         else:
             print("self.build_widget is None!")
             return 
 
     def show_custom_solver_help(self):
         """显示自定义求解器帮助信息"""
-        help_text = (
-            "How to add custom solvers:\n\n"
-            "├── solver/\n"
-            "│   ├── Solver_v1.0/\n"
-            "│   │   └── MInDes.exe\n"
-            "│   │   └── ...\n"
-            "│   └── Solver_v2.0/\n"
-            "│   │   └── MInDes.exe\n"
-            "│   │   └── ...\n"
-            "│   └── Custom Solver/\n"
-            "│   │   └── MInDes.exe\n"
-            "│   │   └── ...\n"
-            "│   └── .../\n"
-            "└── MInDes-UI.exe\n"
-            "└── ..."
-        )
-        QMessageBox.information(self, "Custom Solver Guide", help_text)
+        QMessageBox.information(self, "Custom Solver Guide", _CUSTOM_SOLVER_HELP)
 
     def closeEvent(self, event: QCloseEvent) -> None:
         self.settings.setValue("last_directory", self.file_browser.current_path)
 
-        if self.build_widget and self.build_widget.is_running:
-            reply = QMessageBox.question(
-                self,
-                "Solver Running",
-                "A solver is still running. Stop it and exit?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                QMessageBox.StandardButton.No,
-            )
-            if reply != QMessageBox.StandardButton.Yes:
-                event.ignore()
-                return
+        if self.build_widget:
+            if self.build_widget.is_running:
+                reply = QMessageBox.question(
+                    self,
+                    "Solver Running",
+                    "A solver is still running. Stop it and exit?",
+                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                    QMessageBox.StandardButton.No,
+                )
+                if reply != QMessageBox.StandardButton.Yes:
+                    event.ignore()
+                    return
 
+            # 常驻 solver 线程即使空闲也必须 quit+wait，
+            # 否则 QThread 在析构时仍在运行会直接崩溃
             stopped_cleanly = self.build_widget.shutdown_solver(timeout_ms=5000)
             if not stopped_cleanly:
                 QMessageBox.warning(
@@ -622,12 +820,26 @@ class MainWindow(QMainWindow):
 
 
 if __name__ == "__main__":
+    # 必须在 QApplication 构造前设置：VTS 页内嵌 VTK 的 QOpenGLWidget，
+    # 共享上下文可避免其首次显示时重建 OpenGL context
+    QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts, True)
     app = QApplication(sys.argv)
+    QPixmapCache.setCacheLimit(20 * 1024)  # 20 MiB，容纳 logo/icon 等解码结果
 
     splash = make_splash()
     splash.show()
     app.processEvents()
 
+    # 在 splash 展示期间并行预热两个必然用到的控件模块；
+    # 后续的 from ... import 会直接命中 sys.modules（import 锁保证安全）
+    import importlib
+    from concurrent.futures import ThreadPoolExecutor
+
+    _prefetch = ThreadPoolExecutor(max_workers=2)
+    _prefetch.submit(importlib.import_module, "file_browser_widget")
+    _prefetch.submit(importlib.import_module, "build_simulation_widget")
+    _prefetch.shutdown(wait=False)
+
     def startup_progress(current, total, text):
         update_splash_progress(splash, current, total, text)
 
@@ -635,6 +847,9 @@ if __name__ == "__main__":
     window = MainWindow(startup_progress=startup_progress)
 
     startup_progress(8, 8, "Startup complete.")
+    # 启动结束后丢弃进度回调：延迟构建的标签页工厂不再刷 splash，
+    # 也不会在 currentChanged 处理中途 processEvents 重入标签切换
+    window.startup_progress = None
     window.show()
 
     # 启动后自动打开命令行传入的 .mindes / 文件夹
@@ -2,27 +2,185 @@
 import os
 import sys
 import re
+import codecs
+import hashlib
+import selectors
+import operator
+import functools
 import subprocess
 import threading
+import time
+from collections import namedtuple
 from pathlib import Path
-from log_statistics_widget import STAT_CANDIDATES, get_existing_candidates_by_mtime
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QPushButton, QComboBox,
-    QPlainTextEdit, QLabel, QMenu, QMessageBox, QListWidget, 
-    QListWidgetItem, QDialog, QTableWidget, QTableWidgetItem, QHeaderView, 
-    QTextEdit, QTabWidget, QDialogButtonBox, QApplication, QFrame, QProgressBar, QSizePolicy
+    QPlainTextEdit, QLabel, QMenu, QMessageBox, QListWidget,
+    QListWidgetItem, QDialog, QTableWidget, QTableWidgetItem, QTableView, QHeaderView,
+    QTextEdit, QTabWidget, QDialogButtonBox, QApplication, QFrame, QProgressBar, QSizePolicy,
+    QCheckBox
 )
 from PySide6.QtGui import (
-    QAction, QTextCursor, QSyntaxHighlighter, QTextCharFormat, QPainter, 
-    QColor, QTextBlock, QFont, QKeySequence, QShortcut, QClipboard, QTextFormat
+    QAction, QTextCursor, QSyntaxHighlighter, QTextCharFormat, QPainter,
+    QColor, QTextBlock, QTextBlockUserData, QFont, QKeySequence, QShortcut,
+    QClipboard, QTextFormat, QStaticText, QFontDatabase
+)
+from PySide6.QtCore import (
+    Qt, Signal, QRect, QSize, QThread, QObject, QTimer, QEvent, QPointF,
+    QAbstractTableModel, QModelIndex
 )
-from PySide6.QtCore import Qt, Signal, QRect, QSize, QThread, QObject, QTimer
 
 EDITOR_BACKGROUND = "#f0f0f0"
 PROGRESS_COLUMN_CANDIDATES = ["progress"]
 SIM_STEP_COLUMN_CANDIDATES = ["sim_step", "istep"]
 PROGRESS_POLL_INTERVAL_MS = 500
 
+# 高亮用正则：模式固定，进程内只编译一次，供各高亮器实例共享
+_TAG_RE = re.compile(r'\[(?:DEFAULT|-VALID-)\]')
+# report 行特征（$ / | / default functions）：一次扫描代替三次独立探测
+_REPORT_FEATURE_RE = re.compile(r'[$|]|default functions', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=None)
+def _fmt(color: str, bold: bool = False, italic: bool = False) -> QTextCharFormat:
+    """按 (颜色, 粗体, 斜体) 缓存 QTextCharFormat，供所有高亮器实例共享"""
+    fmt = QTextCharFormat()
+    fmt.setForeground(QColor(color))
+    if bold:
+        fmt.setFontWeight(QFont.Weight.Bold)
+    if italic:
+        fmt.setFontItalic(True)
+    return fmt
+
+
+@functools.lru_cache(maxsize=1)
+def _mono_family() -> str:
+    """取首个可用的等宽字体族名；查一次字体库后进程内缓存"""
+    available = set(QFontDatabase.families())
+    for family in ("Consolas", "Courier New", "Monaco", "DejaVu Sans Mono"):
+        if family in available:
+            return family
+    return "monospace"
+
+
+# 右侧值需要覆盖着色的特殊符号（括号与 , @ $）
+_SYMBOL_RE = re.compile(r'[()\[\]{},@$]')
+# 宏/元组/数值/布尔/符号的合并交替：一次引擎遍历扫完全部 token；
+# 宏与元组分支在前，自然吞掉其内部的数字/布尔匹配，落单的符号
+# 由末位的 sym 分支兜底
+_VALUE_RE = re.compile(
+    r'(?P<macro>\$[^$]+\$)'
+    r'|(?P<tuple>\([^)]+\))'
+    r'|(?P<num>\b\d+(?:\.\d+)?\b)'
+    r'|(?P<bool>\b(?:true|false)\b)'
+    r'|(?P<sym>[()\[\]{},@$])',
+    re.IGNORECASE,
+)
+# input_report 解析产物的行记录：namedtuple 一次 C 调用完成分配，
+# 比逐键构造 dict 轻得多，大报表（上千行定义）时差异明显
+Variable = namedtuple("Variable", "no name value")
+Function = namedtuple("Function", "no name expr")
+Parameter = namedtuple("Parameter", "tag name value")
+Macro = namedtuple("Macro", "name signature value")
+
+
+class _DefRow:
+    """Custom Definitions 表格的合并行：同名变量/函数归并时需就地改写，
+    用 __slots__ 类代替每行一个 dict，省掉哈希表开销"""
+
+    __slots__ = ("no", "name", "expression", "value", "has_var", "has_func")
+
+    def __init__(self, no, name, expression, value, has_var, has_func):
+        self.no = no
+        self.name = name
+        self.expression = expression
+        self.value = value
+        self.has_var = has_var
+        self.has_func = has_func
+
+# input_report 区块标题：单次 search 替代每行五个子串探测
+_REPORT_HEADER_RE = re.compile(
+    r'(?P<var>NO\.\t\tVARIABLE\t\|VALUE)'
+    r'|(?P<func>NO\.\t\tFUNCTIONS\t\|CONTENT)'
+    r'|(?P<param>Parameters Definition)'
+    r'|(?P<macro>M a c r o)'
+    r'|(?P<deffunc>default functions)'
+)
+# input_report 解析辅助函数用正则（逐行调用，模块级一次编译）
+_PARAM_RE = re.compile(r'>\s*\[([^\]]+)\]\s*([^=]+?)\s*=\s*(.+)')
+_PARAM_IDX_RE = re.compile(r'[\(\[\{]\d+[\)\]\}]$')
+_PARAM_CALL_RE = re.compile(r'\w+\(\d+\)$')
+_MACRO_DEF_RE = re.compile(r'\$([A-Za-z_]\w*)(\[[^\]]*\])\$\s*=\s*(.*?)(?=\s*,\s*\$|$)')
+_QUOTED_RE = re.compile(r'"([^"]+)"')
+_TUPLE_FULL_RE = re.compile(r'\([^)]+\)')
+# clean_function_expression 用
+_PLUS_PAREN_RE = re.compile(r'\+\s*\(')
+_PLUS_NAME_RE = re.compile(r'\+\s*([a-zA-Z_]\w*)')
+_PLUS_NUM_RE = re.compile(r'\+\s*(\d+(?:\.\d+)?)')
+_PLUS_TAIL_RE = re.compile(r'\+\s*')
+_MUL_LEFT_RE = re.compile(r'(\w)\*')
+_MUL_RIGHT_RE = re.compile(r'\*(\w)')
+_WS_RE = re.compile(r'\s+')
+
+
+# 状态栏 QSS：五种状态只在颜色上不同，进程内只构造一次
+_STATUS_QSS_TEMPLATE = """
+    QLabel {{
+        background-color: #f0f0f0;  /* 淡灰色 */
+        color: {color};
+        padding: 2px 4px;
+        border: 1px solid #ccc;
+        border-radius: 2px;
+        font-weight: bold;
+    }}
+"""
+_STATUS_QSS = {
+    "error": _STATUS_QSS_TEMPLATE.format(color="red"),
+    "warning": _STATUS_QSS_TEMPLATE.format(color="orange"),
+    "success": _STATUS_QSS_TEMPLATE.format(color="green"),
+    "info": _STATUS_QSS_TEMPLATE.format(color="blue"),
+    "default": _STATUS_QSS_TEMPLATE.format(color="gray"),
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _clean_function_expression(expr: str) -> str:
+    """
+    清理函数表达式中的调试标记
+    示例:
+      输入: '+{+[(VarName)*pow(VarName,2)]}'
+      输出: 'VarName * pow(VarName, 2)'
+
+    模块级函数 + lru_cache：同一表达式（弹窗 Refresh 反复解析时很常见）
+    只跑一次正则链；不做成方法是为了避免缓存键里带上 self。
+    """
+    s = expr.strip()
+    if not s:
+        return expr
+
+    # 移除最外层的 { } 或 [ ]（递归移除）
+    while (s.startswith('{') and s.endswith('}')) or (s.startswith('[') and s.endswith(']')):
+        s = s[1:-1].strip()
+
+    # 移除所有前导 '+'（包括 "+(" 和 "+Var"）
+    # 处理 "+(...)" → "(...)"
+    s = _PLUS_PAREN_RE.sub('(', s)
+    # 处理 "+变量" → "变量"
+    s = _PLUS_NAME_RE.sub(r'\1', s)
+    # 处理 "+数字" → "数字"
+    s = _PLUS_NUM_RE.sub(r'\1', s)
+    # 移除孤立的 '+'（如结尾）
+    s = _PLUS_TAIL_RE.sub(' ', s)
+
+    # 可选：美化运算符（增加空格）
+    s = _MUL_LEFT_RE.sub(r'\1 * ', s)
+    s = _MUL_RIGHT_RE.sub(r' * \1', s)
+
+    # 合并多余空格
+    s = _WS_RE.sub(' ', s).strip()
+
+    return s if s else expr
+
+
 def get_solver_dir() -> Path:
     """ 获取 solver 文件夹路径（返回 pathlib.Path 对象） """
     if getattr(sys, 'frozen', False):
@@ -38,24 +196,40 @@ class SolverRunner(QObject):
     finished = Signal()
     canceled = Signal()
     error = Signal(str)
-    output_received = Signal(str)  # 可选：用于实时日志
+    output_received = Signal(str)  # 可选：用于实时日志（多行按批合并发射）
 
-    def __init__(self, solver_path, input_base, cwd, cleanup_files=None, omp_threads=4):
+    def __init__(self, solver_path=None, input_base=None, cwd=None, cleanup_files=None,
+                 omp_threads=4, affinity_mode="compute"):
         super().__init__()
+        self._current_run_mode = None
+        self.configure(solver_path, input_base, cwd, cleanup_files, omp_threads, affinity_mode)
+
+    def configure(self, solver_path, input_base, cwd, cleanup_files=None,
+                  omp_threads=4, affinity_mode="compute"):
+        """设置下一次运行的参数并复位状态（常驻 worker 每次跑前调用）
+
+        affinity_mode: "compute"（计算密集，线程紧凑排布）或
+        "memory"（访存密集，线程分散到各插槽/核并减半线程数）。
+        """
         self.solver_path = solver_path
         self.input_base = input_base
         self.cwd = cwd
         self.cleanup_files = cleanup_files or []
+        self.affinity_mode = affinity_mode
+        if affinity_mode == "memory":
+            # 访存受限时减少线程数，缓解内存带宽争用
+            omp_threads = max(1, int(omp_threads) // 2)
         self.omp_threads = str(omp_threads)
         self._proc = None  # 保存 Popen 对象，用于 cancel
         self._canceled = False
-        self._current_run_mode = None
 
     def _cleanup_files(self):
         for f in self.cleanup_files:
             try:
-                os.remove(f)
+                # missing_ok 吞掉最常见的"文件已不存在"，不再走异常分派
+                Path(f).unlink(missing_ok=True)
             except OSError:
+                # 仍可能出现占用/权限问题（尤其 Windows），不让它中断收尾
                 pass
 
     def run(self):
@@ -63,8 +237,25 @@ class SolverRunner(QObject):
             # 设置环境变量：限制 OpenMP 线程数
             env = os.environ.copy()
             env["OMP_NUM_THREADS"] = self.omp_threads
-            # 可选：Intel OpenMP 亲和性（提升性能）
-            env["KMP_AFFINITY"] = "granularity=fine,compact,1,0"
+            # 同步限制 solver 内部可能调用的 BLAS/LAPACK 线程池，防止各库
+            # 自行探测核数导致超订阅
+            env["MKL_NUM_THREADS"] = self.omp_threads
+            env["OPENBLAS_NUM_THREADS"] = self.omp_threads
+            env["VECLIB_MAXIMUM_THREADS"] = self.omp_threads
+            env["NUMEXPR_NUM_THREADS"] = self.omp_threads
+            if sys.platform.startswith("linux"):
+                # 抑制 OpenBLAS 自带的线程绑核，避免与 OpenMP 亲和性冲突
+                env.setdefault("OPENBLAS_MAIN_FREE", "1")
+            # OpenMP 亲和性按负载类型选择：
+            # 计算密集 -> 紧凑排布共享缓存；访存密集 -> 分散排布用满各插槽带宽
+            if self.affinity_mode == "memory":
+                env["KMP_AFFINITY"] = "granularity=fine,scatter"
+                env["OMP_PROC_BIND"] = "spread"
+                env["OMP_PLACES"] = "cores"
+            else:
+                env["KMP_AFFINITY"] = "granularity=fine,compact,1,0"
+                env["OMP_PROC_BIND"] = "close"
+                env["OMP_PLACES"] = "cores"
 
             # 构建命令
             cmd = [self.solver_path]
@@ -86,18 +277,21 @@ class SolverRunner(QObject):
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
                 text=True,
-                bufsize=1,  # 行缓冲
-                universal_newlines=True,
+                encoding="utf-8",
+                errors="replace",  # 容忍 solver 输出中的个别坏字节，避免读线程被解码异常杀死
+                bufsize=65536,  # 大块缓冲，减少管道读取的系统调用
                 startupinfo=startupinfo,
             )
             self.started.emit()
 
-            # 实时读取输出（可选）
+            # 实时读取输出（可选）：按批聚合后再跨线程发信号，
+            # 避免高频输出的求解器每行触发一次 Qt 信号派发
             if self._proc.stdout is not None:
-                for line in self._proc.stdout:
-                    if self._canceled:
-                        break
-                    self.output_received.emit(line.rstrip())
+                if sys.platform == "win32":
+                    # Windows 管道不支持 select，退回阻塞按行读取
+                    self._drain_output_blocking()
+                else:
+                    self._drain_output_polling()
 
             return_code = self._proc.wait()  # 等待进程结束
 
@@ -125,6 +319,65 @@ class SolverRunner(QObject):
         finally:
             self._proc = None
 
+    def _drain_output_blocking(self):
+        """阻塞按行读取 stdout，按批聚合后发射"""
+        batch = []
+        last_flush = time.monotonic()
+        for line in self._proc.stdout:
+            if self._canceled:
+                return
+            batch.append(line.rstrip())
+            now = time.monotonic()
+            if len(batch) >= 64 or now - last_flush > 0.05:
+                self.output_received.emit('\n'.join(batch))
+                batch.clear()
+                last_flush = now
+        if batch:
+            self.output_received.emit('\n'.join(batch))
+
+    def _drain_output_polling(self):
+        """POSIX：非阻塞轮询 stdout
+
+        阻塞的行迭代会卡在 C 层缓冲里，求解器停止打印时 cancel 只能
+        等 terminate 生效；改为 100ms 超时的 select 轮询，每轮检查
+        取消标志，取消延迟上限即轮询周期。
+        """
+        fd = self._proc.stdout.fileno()
+        os.set_blocking(fd, False)
+        decoder = codecs.getincrementaldecoder('utf-8')('replace')
+        sel = selectors.DefaultSelector()
+        sel.register(fd, selectors.EVENT_READ)
+        batch = []
+        pending = ''
+        last_flush = time.monotonic()
+        try:
+            while not self._canceled:
+                ready = sel.select(0.1)
+                if ready:
+                    chunk = os.read(fd, 65536)
+                    if not chunk:
+                        break  # EOF
+                    pending += decoder.decode(chunk)
+                    if '\n' in pending:
+                        lines = pending.split('\n')
+                        pending = lines.pop()
+                        batch.extend(l.rstrip() for l in lines)
+                elif self._proc.poll() is not None:
+                    break  # 进程已退出且无新输出
+                now = time.monotonic()
+                if batch and (len(batch) >= 64 or now - last_flush > 0.05):
+                    self.output_received.emit('\n'.join(batch))
+                    batch.clear()
+                    last_flush = now
+            if not self._canceled:
+                pending += decoder.decode(b'', final=True)
+                if pending:
+                    batch.append(pending.rstrip())
+                if batch:
+                    self.output_received.emit('\n'.join(batch))
+        finally:
+            sel.close()
+
     def cancel(self):
         """槽函数：由 worker 所在线程执行，安全取消任务"""
         self._canceled = True
@@ -149,7 +402,15 @@ class LineNumberArea(QFrame):
 
     def paintEvent(self, event):
         self.editor.line_number_area_paint_event(event)
-   
+
+class _HighlightCache(QTextBlockUserData):
+    """缓存块文本哈希与算好的格式区段，供内容未变的重高亮直接回放"""
+
+    def __init__(self, text_hash, ranges):
+        super().__init__()
+        self.text_hash = text_hash
+        self.ranges = ranges
+
 class MindesSyntaxHighlighter(QSyntaxHighlighter):
     def __init__(self, parent=None):
         if parent is not None:
@@ -160,17 +421,18 @@ class MindesSyntaxHighlighter(QSyntaxHighlighter):
         
         # ========== 深色彩虹渐变方案 (10种加深颜色) ==========
         # 从深红到深紫的渐变，确保在白色背景下有高对比度
+        # （存十六进制串，作为 _fmt 共享缓存的键）
         self.rainbow_colors = [
-            QColor("#CC0000"),  # 深红色（原#FF3333）
-            QColor("#CC5500"),  # 深橙红色（原#FF6600）
-            QColor("#CC7700"),  # 深橙色（原#FF9900）
-            QColor("#CC9900"),  # 深金黄色（原#FFCC00）
-            QColor("#779900"),  # 深黄绿色（原#99CC00）
-            QColor("#009900"),  # 深绿色（原#33CC33）
-            QColor("#008866"),  # 深蓝绿色（原#00CC99）
-            QColor("#006699"),  # 深蓝色（原#0099CC）
-            QColor("#552299"),  # 深蓝紫色（原#6633CC）
-            QColor("#772299"),  # 深紫色（原#9933CC）
+            "#CC0000",  # 深红色（原#FF3333）
+            "#CC5500",  # 深橙红色（原#FF6600）
+            "#CC7700",  # 深橙色（原#FF9900）
+            "#CC9900",  # 深金黄色（原#FFCC00）
+            "#779900",  # 深黄绿色（原#99CC00）
+            "#009900",  # 深绿色（原#33CC33）
+            "#008866",  # 深蓝绿色（原#00CC99）
+            "#006699",  # 深蓝色（原#0099CC）
+            "#552299",  # 深蓝紫色（原#6633CC）
+            "#772299",  # 深紫色（原#9933CC）
         ]
         
         # 特殊符号格式（保持黑色，对比度最高）
@@ -193,8 +455,7 @@ class MindesSyntaxHighlighter(QSyntaxHighlighter):
         }
         
         # 注释格式（加深为深灰色）
-        self.comment_format = self._create_format("#3E8E00", True)  # 深绿色斜体
-        self.comment_format.setFontItalic(True)
+        self.comment_format = _fmt("#3E8E00", bold=True, italic=True)  # 深绿色斜体
         
         # 右侧值类型格式（全部加深）
         self.value_formats = {
@@ -203,162 +464,149 @@ class MindesSyntaxHighlighter(QSyntaxHighlighter):
             'boolean': self._create_format("#660066", True),      # 深紫色加粗，布尔值
             'at_content': self._create_format("#006666", True),   # 深青色加粗，@...@内容
         }
-        
-        # 预编译正则表达式（提高性能）
-        self.number_pattern = re.compile(r'\b\d+(\.\d+)?\b')
-        self.boolean_pattern = re.compile(r'\b(true|false)\b', re.IGNORECASE)
-        self.tuple_pattern = re.compile(r'\([^)]+\)')
-        self.macro_pattern = re.compile(r'\$[^$]+\$')
-        
-    def _create_format(self, color, bold=False):
-        """创建文本格式的辅助方法"""
-        fmt = QTextCharFormat()
-        fmt.setForeground(QColor(color))
-        if bold:
-            fmt.setFontWeight(QFont.Weight.Bold)
-        return fmt
-    
-    def _get_token_color_index(self, token_index):
-        """根据token索引获取彩虹色索引"""
-        if token_index < len(self.rainbow_colors):
-            return token_index
-        else:
-            # 超过10个token，循环使用第10个颜色（深紫色）
-            return len(self.rainbow_colors) - 1
+
+        # 彩虹色格式矩阵：10 色 × {普通, 加粗}，键路径逐 token 直接索引
+        self._rainbow_fmts = [
+            [self._create_format(c, False), self._create_format(c, True)]
+            for c in self.rainbow_colors
+        ]
+
+        # 符号 → 格式的合并查找表，供值扫描单次索引
+        self._symbol_lut = dict(self.brace_formats)
+        for key in (',', '@', '$'):
+            self._symbol_lut[key] = self.symbol_formats[key]
+
+        # 超深层级统一用最后一色（深紫色），索引钳位内联在扫描循环里
+        self._max_color_idx = len(self.rainbow_colors) - 1
+
+    @staticmethod
+    def _create_format(color, bold=False):
+        """创建文本格式的辅助方法（走模块级共享缓存）"""
+        return _fmt(color, bold)
 
     def highlightBlock(self, text):
         """高亮处理一个文本块"""
+        # 空行直接跳过
+        if not text:
+            return
+
+        # Qt 每次调用前都会清空块格式，无法整体短路；
+        # 但内容未变的块可直接回放上次算好的区段，省掉全部正则扫描
+        text_hash = hash(text)
+        cached = self.currentBlockUserData()
+        if isinstance(cached, _HighlightCache) and cached.text_hash == text_hash:
+            for start, count, fmt in cached.ranges:
+                self.setFormat(start, count, fmt)
+            return
+
+        self._ranges = []
+        self._do_highlight(text)
+        # 区段全部算完后一次性写入（相邻同格式段已合并，调用次数更少）
+        for start, count, fmt in self._ranges:
+            self.setFormat(start, count, fmt)
+        self.setCurrentBlockUserData(_HighlightCache(text_hash, self._ranges))
+
+    def _apply_format(self, start, count, fmt):
+        """记录一个格式区段；与上一段相邻且格式相同时就地合并。
+
+        按发射顺序保存，后写覆盖先写的层叠语义与直接 setFormat 一致。
+        """
+        ranges = self._ranges
+        if ranges:
+            last_start, last_count, last_fmt = ranges[-1]
+            if last_fmt is fmt and last_start + last_count == start:
+                ranges[-1] = (last_start, last_count + count, fmt)
+                return
+        ranges.append((start, count, fmt))
+
+    def _do_highlight(self, text):
         line = text.rstrip()
-        
+
         # 1. 注释行处理
         if line.startswith('#'):
-            self.setFormat(0, len(text), self.comment_format)
+            self._apply_format(0, len(text), self.comment_format)
             return
-        
-        # 2. 分割键值对
-        if '=' in line:
-            eq_pos = line.find('=')
-            left_side = line[:eq_pos].rstrip()
-            right_side = line[eq_pos + 1:].lstrip()
+
+        # 2. 非键值对行快速跳过：没有 = 就没有任何可高亮的内容
+        eq_pos = line.find('=')
+        if eq_pos == -1:
+            return
+        left_side = line[:eq_pos].rstrip()
+        rhs_raw = line[eq_pos + 1:]
+        right_side = rhs_raw.lstrip()
             
-            # ========== 左侧键路径高亮 (深彩虹色渐变) ==========
-            if left_side:
-                # 按点号分割并高亮
-                start = 0
-                tokens = left_side.split('.')
-                for i, token in enumerate(tokens):
-                    if token:
-                        # 使用深彩虹色，每个层级使用不同颜色
-                        color_index = self._get_token_color_index(i)
-                        fmt = self._create_format(
-                            self.rainbow_colors[color_index], 
-                            i == 0  # 第一级加粗
-                        )
-                        
-                        self.setFormat(start, len(token), fmt)
-                        start += len(token)
-                    
-                    # 高亮点号（深灰色）
-                    if i < len(tokens) - 1:
-                        self.setFormat(start, 1, self.symbol_formats['.'])
-                        start += 1
+        # ========== 左侧键路径高亮 (深彩虹色渐变) ==========
+        if left_side:
+            # 先铺 token 颜色、再统一补点号：两个紧凑循环，偏移直接累加
+            off = 0
+            for i, token in enumerate(left_side.split('.')):
+                if token:
+                    # 使用深彩虹色，每个层级使用不同颜色；第一级加粗
+                    fmt = self._rainbow_fmts[min(i, self._max_color_idx)][1 if i == 0 else 0]
+                    self._apply_format(off, len(token), fmt)
+                off += len(token) + 1  # 跳过 token 与其后的点号
+
+            # 高亮点号（深灰色）
+            dot_fmt = self.symbol_formats['.']
+            dot = left_side.find('.')
+            while dot != -1:
+                self._apply_format(dot, 1, dot_fmt)
+                dot = left_side.find('.', dot + 1)
             
-            # 高亮等号（黑色加粗）
-            self.setFormat(eq_pos, 1, self.symbol_formats['='])
+        # 高亮等号（黑色加粗）
+        self._apply_format(eq_pos, 1, self.symbol_formats['='])
             
-            # ========== 右侧值高亮 ==========
-            if right_side:
-                right_start = eq_pos + 1 + line[eq_pos + 1:].find(right_side)
+        # ========== 右侧值高亮 ==========
+        if right_side:
+            # 左侧空白宽度用长度差算出，免去一次子串搜索
+            right_start = eq_pos + 1 + (len(rhs_raw) - len(right_side))
                 
-                # 先按类型高亮内容
-                self._highlight_value_content(right_start, right_side)
-                
-                # 再高亮特殊符号（会覆盖内容颜色）
-                self._highlight_symbols(right_start, right_side)
+            # 内容与特殊符号在同一次交替扫描中完成
+            self._highlight_value_content(right_start, right_side)
     
     def _highlight_value_content(self, start_pos, text):
         """高亮右侧值的具体内容"""
-        # 1. 高亮宏变量 $...$
-        for match in self.macro_pattern.finditer(text):
-            macro_start = start_pos + match.start()
-            macro_text = match.group()
-            # $符号本身用黑色
-            self.setFormat(macro_start, 1, self.symbol_formats['$'])
-            self.setFormat(macro_start + len(macro_text) - 1, 1, self.symbol_formats['$'])
-            # 宏内容用深红色
-            self.setFormat(macro_start + 1, len(macro_text) - 2, self.value_formats['macro'])
-        
-        # 2. 高亮元组 (..., ...)
-        for match in self.tuple_pattern.finditer(text):
-            # 避免匹配宏内的括号
-            match_start = match.start()
-            match_end = match.end()
-            if not any(m.start() < match_start < m.end() for m in self.macro_pattern.finditer(text)):
+        # 1-5. 宏 / 元组 / 数值 / 布尔 / 符号：单次交替扫描。宏与元组
+        # 分支优先，其内部的数字/布尔被整体匹配吞掉，无需再做包含性
+        # 判断；其内部的符号用子扫描覆盖着色（仅限命中的片段）
+        lut = self._symbol_lut
+        for match in _VALUE_RE.finditer(text):
+            kind = match.lastgroup
+            m_start = start_pos + match.start()
+            m_len = match.end() - match.start()
+            if kind == 'macro':
+                # $符号本身用黑色，宏内容用深红色
+                self._apply_format(m_start, 1, self.symbol_formats['$'])
+                self._apply_format(m_start + 1, m_len - 2, self.value_formats['macro'])
+                self._apply_format(m_start + m_len - 1, 1, self.symbol_formats['$'])
+                for sym in _SYMBOL_RE.finditer(text, match.start() + 1, match.end() - 1):
+                    self._apply_format(start_pos + sym.start(), 1, lut[sym.group()])
+            elif kind == 'tuple':
                 # 使用括号的深棕色
-                self.setFormat(start_pos + match_start, match_end - match_start, self.brace_formats['('])
-        
-        # 3. 高亮数值
-        for match in self.number_pattern.finditer(text):
-            # 避免匹配元组或宏内的数字
-            num_start = match.start()
-            if not self._is_inside_special(text, num_start, ['(', '$']):
-                self.setFormat(start_pos + num_start, match.end() - num_start, self.value_formats['number'])
-        
-        # 4. 高亮布尔值
-        for match in self.boolean_pattern.finditer(text):
-            bool_start = match.start()
-            if not self._is_inside_special(text, bool_start, ['(', '$']):
-                self.setFormat(start_pos + bool_start, match.end() - bool_start, self.value_formats['boolean'])
-        
+                self._apply_format(m_start, m_len, self.brace_formats['('])
+                for sym in _SYMBOL_RE.finditer(text, match.start(), match.end()):
+                    self._apply_format(start_pos + sym.start(), 1, lut[sym.group()])
+            elif kind == 'num':
+                self._apply_format(m_start, m_len, self.value_formats['number'])
+            elif kind == 'bool':
+                self._apply_format(m_start, m_len, self.value_formats['boolean'])
+            else:  # sym
+                self._apply_format(m_start, 1, lut[match.group()])
+
         # 5. 高亮Define中的@...@内容
         if '@' in text:
             at_start = text.find('@')
             at_end = text.rfind('@')
             if at_start != -1 and at_end != -1 and at_start < at_end:
                 # @符号本身
-                self.setFormat(start_pos + at_start, 1, self.symbol_formats['@'])
-                self.setFormat(start_pos + at_end, 1, self.symbol_formats['@'])
+                self._apply_format(start_pos + at_start, 1, self.symbol_formats['@'])
+                self._apply_format(start_pos + at_end, 1, self.symbol_formats['@'])
                 # @之间的内容
-                self.setFormat(start_pos + at_start + 1, at_end - at_start - 1, self.value_formats['at_content'])
-    
-    def _highlight_symbols(self, start_pos, text):
-        """高亮特殊符号"""
-        for i, char in enumerate(text):
-            pos = start_pos + i
-            if char in self.brace_formats:
-                self.setFormat(pos, 1, self.brace_formats[char])
-            elif char in [',', '@', '$']:
-                # 确保符号颜色覆盖其他高亮
-                if char == ',':
-                    self.setFormat(pos, 1, self.symbol_formats[','])
-                elif char == '@':
-                    self.setFormat(pos, 1, self.symbol_formats['@'])
-                elif char == '$':
-                    self.setFormat(pos, 1, self.symbol_formats['$'])
-    
-    def _is_inside_special(self, text, position, symbols):
-        """检查位置是否在特殊结构内"""
-        for i in range(position):
-            if text[i] in symbols:
-                # 找到最近的配对符号
-                pair_map = {'(': ')', '[': ']', '{': '}', '$': '$'}
-                opening = text[i]
-                closing = pair_map.get(opening)
-                if closing:
-                    # 查找配对的闭合符号
-                    depth = 1
-                    for j in range(i + 1, len(text)):
-                        if text[j] == opening:
-                            depth += 1
-                        elif text[j] == closing:
-                            depth -= 1
-                            if depth == 0:
-                                # 如果位置在这个配对内
-                                if i < position < j:
-                                    return True
-                                break
-        return False
-    
+                self._apply_format(start_pos + at_start + 1, at_end - at_start - 1, self.value_formats['at_content'])
+                # 内容覆盖了扫描阶段的符号色，补扫 @...@ 内部的符号
+                for sym in _SYMBOL_RE.finditer(text, at_start + 1, at_end):
+                    self._apply_format(start_pos + sym.start(), 1, lut[sym.group()])
+
 class ReportSyntaxHighlighter(QSyntaxHighlighter):
     """专门用于 input_report.txt 文件的高亮器（简化版）"""
     
@@ -369,119 +617,122 @@ class ReportSyntaxHighlighter(QSyntaxHighlighter):
             print("Error when initializing SyntaxHighlighter")
             print("QSyntaxHighlighter parent is None")
         
-        # ========== 颜色定义 ==========
-        
+        # ========== 颜色定义（全部取自模块级共享格式缓存）==========
+
         # 标题/分隔线格式
-        self.title_format = QTextCharFormat()
-        self.title_format.setForeground(QColor("#4A5568"))  # 深灰色
-        self.title_format.setFontWeight(QFont.Weight.Bold)
-        
+        self.title_format = _fmt("#4A5568", bold=True)  # 深灰色
+
         # 宏格式（深红色）
-        self.macro_format = QTextCharFormat()
-        self.macro_format.setForeground(QColor("#8B0000"))  # 深红色
-        
+        self.macro_format = _fmt("#8B0000")
+
         # Define 格式（深绿色）
-        self.define_format = QTextCharFormat()
-        self.define_format.setForeground(QColor("#006400"))  # 深绿色
-        
+        self.define_format = _fmt("#006400")
+
         # 默认函数格式（灰色斜体）
-        self.default_func_format = QTextCharFormat()
-        self.default_func_format.setForeground(QColor("#666666"))
-        self.default_func_format.setFontItalic(True)
-        
-        # DEBUG 表格标题格式（蓝色）
-        self.debug_header_format = QTextCharFormat()
-        self.debug_header_format.setForeground(QColor("#000080"))  # 深蓝色
-        self.debug_header_format.setFontWeight(QFont.Weight.Bold)
-        
+        self.default_func_format = _fmt("#666666", italic=True)
+
+        # DEBUG 表格标题格式（深蓝色加粗）
+        self.debug_header_format = _fmt("#000080", bold=True)
+
         # DEBUG 表格内容格式（黑色）
-        self.debug_content_format = QTextCharFormat()
-        self.debug_content_format.setForeground(QColor("#000000"))
-        
+        self.debug_content_format = _fmt("#000000")
+
         # 参数标记格式
         self.tag_formats = {
-            "[DEFAULT]": QTextCharFormat(),  # 默认蓝色
-            "[-VALID-]": QTextCharFormat(),  # 有效绿色
+            "[DEFAULT]": _fmt("#0000FF"),  # 蓝色
+            "[-VALID-]": _fmt("#E74C3C"),  # 红色
         }
-        self.tag_formats["[DEFAULT]"].setForeground(QColor("#0000FF"))  # 蓝色
-        self.tag_formats["[-VALID-]"].setForeground(QColor("#E74C3C"))  # 红色
-        
+
         # 参数名格式（深蓝色）
-        self.param_name_format = QTextCharFormat()
-        self.param_name_format.setForeground(QColor("#00008B"))
-        
+        self.param_name_format = _fmt("#00008B")
+
         # 参数值格式（深紫色）
-        self.param_value_format = QTextCharFormat()
-        self.param_value_format.setForeground(QColor("#4B0082"))
-        
-        # 注释格式（灰色）
-        self.comment_format = QTextCharFormat()
-        self.comment_format.setForeground(QColor("#007F2A"))  # 深绿色
-        self.comment_format.setFontItalic(True)
-        
+        self.param_value_format = _fmt("#4B0082")
+
+        # 注释格式（深绿色斜体）
+        self.comment_format = _fmt("#007F2A", italic=True)
+
         # 分隔符格式（黑色）
-        self.separator_format = QTextCharFormat()
-        self.separator_format.setForeground(QColor("#000000"))
+        self.separator_format = _fmt("#000000")
 
     def highlightBlock(self, text):
         """高亮处理一个文本块"""
         text_line = text.rstrip()
-        
+
         # 空行不处理
         if not text_line:
             return
-            
+
+        # 先按首字符分派，避免对每一行都跑完整串 startswith/find 扫描
+        first = text_line[0]
+
         # 1. 处理标题/分隔线（以 = 开头或包含大量 =）
-        if text_line.startswith('=') or text_line.replace('=', '') == '':
+        if first == '=':
             self.setFormat(0, len(text), self.title_format)
             return
-            
-        # 2. 处理宏定义（包含 $...$ 的行）
-        if '$' in text_line:
-            # 高亮整个宏部分
-            start_idx = text_line.find('$')
-            end_idx = text_line.rfind('$') + 1
-            if start_idx != -1 and end_idx != -1 and start_idx < end_idx:
-                self.setFormat(start_idx, end_idx - start_idx, self.macro_format)
-        
+
+        # 8. 注释行整行覆盖，后续规则的结果都会被盖掉，直接短路
+        if first == '#':
+            self.setFormat(0, len(text_line), self.comment_format)
+            return
+
+        # 行内特征（$ 位置 / 竖线 / default functions）合并为一次 C 级扫描，
+        # 常见的普通行只被遍历一遍
+        dollar_first = -1
+        dollar_last = -1
+        pipe_positions = []
+        has_default_funcs = False
+        for feature in _REPORT_FEATURE_RE.finditer(text_line):
+            ch = feature.group()
+            if ch == '$':
+                if dollar_first < 0:
+                    dollar_first = feature.start()
+                dollar_last = feature.start()
+            elif ch == '|':
+                pipe_positions.append(feature.start())
+            else:
+                has_default_funcs = True
+
+        # 2. 处理宏定义（包含 $...$ 的行）：高亮整个宏部分
+        if dollar_first != -1 and dollar_first < dollar_last:
+            self.setFormat(dollar_first, dollar_last + 1 - dollar_first, self.macro_format)
+
         # 3. 处理 Define 行
-        if text_line.startswith('Define.'):
+        if first == 'D' and text_line.startswith('Define.'):
             self.setFormat(0, len(text_line), self.define_format)
             # 高亮等号
             if '=' in text_line:
                 eq_pos = text_line.find('=')
                 self.setFormat(eq_pos, 1, self.separator_format)
-        
+
         # 4. 处理默认函数说明行
-        if 'default functions' in text_line.lower():
+        if has_default_funcs:
             self.setFormat(0, len(text_line), self.default_func_format)
-            
+
         # 5. 处理 DEBUG 表格标题
-        if text_line.startswith('LINE') or text_line.startswith('NO.'):
+        if (first == 'L' and text_line.startswith('LINE')) or \
+                (first == 'N' and text_line.startswith('NO.')):
             self.setFormat(0, len(text_line), self.debug_header_format)
-            
+
         # 6. 处理 DEBUG 表格内容（包含 | 的行）
-        if '|' in text_line and not text_line.startswith('---'):
+        if pipe_positions and (first != '-' or not text_line.startswith('---')):
             # 高亮整个行
             self.setFormat(0, len(text_line), self.debug_content_format)
-            # 高亮分隔符 |
-            for i, char in enumerate(text_line):
-                if char == '|':
-                    self.setFormat(i, 1, self.separator_format)
+            # 高亮分隔符 |：位置已在特征扫描中收集，无需逐字符遍历
+            for pos in pipe_positions:
+                self.setFormat(pos, 1, self.separator_format)
         
         # 7. 处理参数定义行（以 > 开头）
-        if text_line.startswith('>'):
-            # 高亮标记 [TAG]
-            tag_start = text_line.find('[')
-            tag_end = text_line.find(']') + 1 if ']' in text_line else -1
-            
-            if tag_start != -1 and tag_end != -1:
-                tag_content = text_line[tag_start:tag_end]
-                for tag, fmt in self.tag_formats.items():
-                    if tag in tag_content:
-                        self.setFormat(tag_start, tag_end - tag_start, fmt)
-                        break
-                        
+        if first == '>':
+            # 高亮标记 [TAG]（单次正则定位，替代 find('[')/find(']') 组合）
+            tag_match = _TAG_RE.search(text_line)
+            if tag_match is not None:
+                tag_end = tag_match.end()
+                self.setFormat(tag_match.start(), tag_end - tag_match.start(),
+                               self.tag_formats[tag_match.group()])
+            else:
+                tag_end = -1
+
             # 高亮参数名（标记之后，等号之前）
             eq_pos = text_line.find('=')
             if eq_pos != -1:
@@ -498,10 +749,59 @@ class ReportSyntaxHighlighter(QSyntaxHighlighter):
                 value_start = eq_pos + 1
                 if value_start < len(text_line):
                     self.setFormat(value_start, len(text_line) - value_start, self.param_value_format)
-        
-        # 8. 处理注释行（以 # 开头）
-        if text_line.startswith('#'):
-            self.setFormat(0, len(text_line), self.comment_format)
+
+class DefinitionsTableModel(QAbstractTableModel):
+    """Custom Definitions 弹窗的表格模型
+
+    用 model/view 替代逐行创建 QTableWidgetItem：单元格数据按需
+    取自 _items，函数名加粗通过 FontRole 返回同一个缓存 QFont，
+    打开/刷新弹窗的开销只与可见行数相关。
+    """
+
+    HEADERS = ("Name", "Value", "Expression")
+    _COLUMN_KEYS = ("name", "value", "expression")
+
+    def __init__(self, items: list, parent=None):
+        super().__init__(parent)
+        self._items = items
+        self._bold_font = QFont()
+        self._bold_font.setBold(True)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._items)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        item = self._items[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return getattr(item, self._COLUMN_KEYS[index.column()])
+        if role == Qt.ItemDataRole.FontRole:
+            # 函数名加粗（与旧 QTableWidget 版本一致）
+            if index.column() == 0 and item.has_func:
+                return self._bold_font
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        key = operator.attrgetter(self._COLUMN_KEYS[column])
+        self.layoutAboutToBeChanged.emit()
+        self._items.sort(key=key, reverse=(order == Qt.SortOrder.DescendingOrder))
+        self.layoutChanged.emit()
+
+    def set_items(self, items: list):
+        """整表换数据（Refresh 用），不重建任何单元格控件"""
+        self.beginResetModel()
+        self._items = items
+        self.endResetModel()
+
 
 class ProgressOverlayWidget(QWidget):
     def __init__(self, parent=None):
@@ -570,10 +870,21 @@ class BuildSimulationWidget(QWidget):
     # 信号：当构建/运行完成时，通知主窗口结果目录路径
     simulationFinished = Signal(str)  # 发送 .mindes 同名结果文件夹路径
     requestCancelSolver = Signal()    # 请求在线程中取消 solver
+    requestRunSolver = Signal()       # 派发一次运行到常驻 worker 线程
     class CodeEditor(QPlainTextEdit):
         def __init__(self, parent=None):
             super().__init__(parent)
             self.line_number_area = LineNumberArea(self)
+            # 行号 → QStaticText 缓存，复用已排版的字形（字体变化时清空）
+            self._static_text_cache = {}
+            self._last_lna_width = -1  # 上次应用的行号区宽度
+            self._cached_lna_width = -1  # 行号区宽度缓存（块数/字体变化时失效）
+            self._digit_advance = None  # '9' 的字宽缓存（字体变化时重算）
+            self._hl_pending = False    # 当前行高亮是否已排队
+            self._last_hl_block = None  # 上次高亮的行号（同行内移动时跳过重建）
+            self._current_line_fmt = QTextCharFormat()
+            self._current_line_fmt.setBackground(QColor("#ffffcc"))  # 淡黄色高亮当前行
+            self._current_line_fmt.setProperty(QTextFormat.Property.FullWidthSelection, True)
             self.blockCountChanged.connect(self.update_line_number_area_width)
             self.updateRequest.connect(self.update_line_number_area)
             self.cursorPositionChanged.connect(self.highlight_current_line)
@@ -581,16 +892,23 @@ class BuildSimulationWidget(QWidget):
             self.highlight_current_line()
 
         def line_number_area_width(self):
-            digits = 1
-            max_num = max(1, self.blockCount())
-            while max_num >= 10:
-                max_num //= 10
-                digits += 1
-            space = 8 + self.fontMetrics().horizontalAdvance('9') * digits
-            return space
+            # 绘制/缩放热路径上 O(1) 返回缓存；块数变化由
+            # update_line_number_area_width 失效，字体变化由 changeEvent
+            if self._cached_lna_width < 0:
+                if self._digit_advance is None:
+                    self._digit_advance = self.fontMetrics().horizontalAdvance('9')
+                digits = len(str(max(1, self.blockCount())))
+                self._cached_lna_width = 8 + self._digit_advance * digits
+            return self._cached_lna_width
 
         def update_line_number_area_width(self):
-            self.setViewportMargins(self.line_number_area_width(), 0, 0, 0)
+            # 宽度没变（位数相同）时跳过 setViewportMargins，避免无谓的布局重排
+            self._cached_lna_width = -1
+            width = self.line_number_area_width()
+            if width == self._last_lna_width:
+                return
+            self._last_lna_width = width
+            self.setViewportMargins(width, 0, 0, 0)
 
         def update_line_number_area(self, rect, dy):
             if dy:
@@ -607,6 +925,13 @@ class BuildSimulationWidget(QWidget):
                 QRect(cr.left(), cr.top(), self.line_number_area_width(), cr.height())
             )
 
+        def changeEvent(self, event):
+            super().changeEvent(event)
+            if event.type() == QEvent.Type.FontChange:
+                self._static_text_cache.clear()
+                self._digit_advance = None
+                self._cached_lna_width = -1
+
         def line_number_area_paint_event(self, event):
             painter = QPainter(self.line_number_area)
             painter.fillRect(event.rect(), QColor(EDITOR_BACKGROUND))  # 淡灰色背景
@@ -616,18 +941,19 @@ class BuildSimulationWidget(QWidget):
             top = self.blockBoundingGeometry(block).translated(self.contentOffset()).top()
             bottom = top + self.blockBoundingRect(block).height()
 
-            height = self.fontMetrics().height()
+            cache = self._static_text_cache
+            right_edge = self.line_number_area.width() - 4
+            painter.setPen(QColor("#666666"))
             while block.isValid() and top <= event.rect().bottom():
                 if block.isVisible() and bottom >= event.rect().top():
-                    number = str(block_number + 1)
-                    painter.setPen(QColor("#666666"))
-                    painter.drawText(
-                        0,
-                        int(top),
-                        self.line_number_area.width() - 4,
-                        height,
-                        Qt.AlignmentFlag.AlignRight,
-                        number
+                    number = block_number + 1
+                    st = cache.get(number)
+                    if st is None:
+                        st = QStaticText(str(number))
+                        st.setTextFormat(Qt.TextFormat.PlainText)
+                        cache[number] = st
+                    painter.drawStaticText(
+                        QPointF(right_edge - st.size().width(), top), st
                     )
                 block = block.next()
                 top = bottom
@@ -635,23 +961,40 @@ class BuildSimulationWidget(QWidget):
                 block_number += 1
 
         def highlight_current_line(self):
+            """合并同一事件循环轮次内的多次光标移动，只重建一次选区"""
+            if self._hl_pending:
+                return
+            self._hl_pending = True
+            QTimer.singleShot(0, self._do_highlight_current_line)
+
+        def _do_highlight_current_line(self):
+            self._hl_pending = False
             extra_selections = []
             if not self.isReadOnly():
-                selection = QTextEdit.ExtraSelection()
-                line_color = QColor("#ffffcc")  # 淡黄色高亮当前行
-                fmt = QTextCharFormat()
-                fmt.setBackground(line_color)
-                fmt.setProperty(QTextFormat.Property.FullWidthSelection, True)
-                setattr(selection, 'format', fmt)
                 cursor = self.textCursor()
+                # 整行高亮只随行号变化，同一行内的光标移动无需重建选区
+                block_num = cursor.blockNumber()
+                if block_num == self._last_hl_block:
+                    return
+                self._last_hl_block = block_num
+                selection = QTextEdit.ExtraSelection()
+                setattr(selection, 'format', self._current_line_fmt)
                 cursor.clearSelection()
                 setattr(selection, 'cursor', cursor)
                 extra_selections.append(selection)
+            else:
+                if self._last_hl_block is None:
+                    return
+                self._last_hl_block = None
             self.setExtraSelections(extra_selections)
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_mindes_file = None  # 当前加载的 .mindes 文件绝对路径
+        self._last_saved_hash = None  # 上次落盘内容的摘要，未变则跳过保存
+        self._last_status_kind = None  # 状态栏当前样式种类，变化时才重设 QSS
+        self._tuple_helper_dialog = None  # Tuple Helper 弹窗，首次使用时构建后复用
+        self._context_sel_text = ""  # 右键菜单弹出时的选区文本快照
         self._project_path = None
         self.selected_solver_path = None  # 当前选中的求解器 exe 的绝对路径
         self.solver_dir = get_solver_dir()  # 求解器根目录（相对主程序）
@@ -660,9 +1003,17 @@ class BuildSimulationWidget(QWidget):
         self.mindes_highlighter = None  # .mindes 文件高亮器
         self.report_highlighter = None  # input_report.txt 高亮器
         self.current_highlighter = None  # 当前活跃的高亮器
+        self._pending_highlighter_is_report = False  # 最近一次切换请求的目标
+        self._highlighter_switch_scheduled = False  # 是否已排队延迟切换
 
         # input report 识别
         self.parsed_definitions = None
+        # parse_input_report 的 stat 缓存：path -> (mtime_ns, size, result)
+        self._report_parse_cache = {}
+        # 视图切换用文件内容缓存：path -> (mtime_ns, size, content)
+        self._file_content_cache = {}
+        # solver/ 目录扫描缓存：(目录 mtime_ns, [(name, exe_path), ...])
+        self._solver_scan_cache = None
 
         # 项目输出目录 / 进度窗状态
         self._progress_timer = QTimer(self)
@@ -671,6 +1022,7 @@ class BuildSimulationWidget(QWidget):
         self._progress_stat_path = None
 
         self.setup_ui()
+        self._build_context_menus()
         self.save_btn.setEnabled(False)
         self.build_btn.setEnabled(False)
         self.run_btn.setEnabled(False)
@@ -692,6 +1044,15 @@ class BuildSimulationWidget(QWidget):
         top_layout.addWidget(QLabel("Solver:"))
         top_layout.addWidget(self.solver_combo)
 
+        # 访存密集模式：切换 OpenMP 线程亲和性策略（见 SolverRunner.configure）
+        self.memory_bound_check = QCheckBox("Memory-bound")
+        self.memory_bound_check.setToolTip(
+            "Spread OpenMP threads across sockets and halve the thread count.\n"
+            "Helps memory-bandwidth-limited solver runs; leave unchecked for\n"
+            "compute-bound workloads."
+        )
+        top_layout.addWidget(self.memory_bound_check)
+
         # Save 按钮（新增）
         self.save_btn = QPushButton("Save")
         self.save_btn.clicked.connect(self.save_current_content)
@@ -822,9 +1183,23 @@ class BuildSimulationWidget(QWidget):
         """)
         top_layout.addWidget(self.cancel_btn)  # 插入到 Run 按钮之后
 
-        # 运行状态管理
-        self.solver_thread = None
-        self.solver_worker = None
+        # 运行状态管理：worker 线程常驻，Build/Run 复用同一个 SolverRunner，
+        # 省去每次运行的 QThread 创建、moveToThread 与信号接线
+        self.solver_thread = QThread(self)
+        self.solver_worker = SolverRunner()
+        self.solver_worker.moveToThread(self.solver_thread)
+        self.requestRunSolver.connect(self.solver_worker.run)
+        # cancel 必须直连：worker 线程阻塞在 run 里，排队的槽等不到执行
+        self.requestCancelSolver.connect(
+            self.solver_worker.cancel, Qt.ConnectionType.DirectConnection)
+        self.solver_worker.started.connect(self.on_solver_started)
+        self.solver_worker.finished.connect(self.on_solver_finished)
+        self.solver_worker.error.connect(self.on_solver_error)
+        self.solver_worker.canceled.connect(self.on_solver_canceled)
+        self.solver_worker.finished.connect(self._on_solver_done)
+        self.solver_worker.error.connect(self._on_solver_done)
+        self.solver_worker.canceled.connect(self._on_solver_done)
+        self.solver_thread.start()
         self.is_running = False
         self._solver_shutdown_in_progress = False
         self._current_run_mode = None
@@ -843,13 +1218,7 @@ class BuildSimulationWidget(QWidget):
         # 并设置：
         self.text_edit.setCenterOnScroll(False)
          # 设置等宽字体以确保字符对齐
-        font = QFont()
-        # 尝试使用常见的等宽字体，按优先级排序
-        font_families = ["Consolas", "Courier New", "Monaco", "DejaVu Sans Mono", "monospace"]
-        for family in font_families:
-            font.setFamily(family)
-            if font.family() == family:  # 检查字体是否可用
-                break
+        font = QFont(_mono_family())
         font.setPointSize(10)
         self.text_edit.setFont(font)
         # 强制白色背景，不随系统主题变化
@@ -864,14 +1233,12 @@ class BuildSimulationWidget(QWidget):
                 border-radius: 4px;
             }}
         """.format(bg=EDITOR_BACKGROUND))
-        # 创建高亮器实例
+        # 创建高亮器实例（report 高亮器延迟到首次查看报告时构建，
+        # 省掉启动期一次无用的构造与挂接/摘除重高亮）
         self.mindes_highlighter = MindesSyntaxHighlighter(self.text_edit.document())
-        self.report_highlighter = ReportSyntaxHighlighter(self.text_edit.document())
-        
+
         # 默认使用 .mindes 高亮器
         self.current_highlighter = self.mindes_highlighter
-        self.mindes_highlighter.setDocument(self.text_edit.document())
-        self.report_highlighter.setDocument(None)  # 禁用报告高亮器
 
         self.text_edit.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.text_edit.customContextMenuRequested.connect(self.show_context_menu)
@@ -973,17 +1340,28 @@ class BuildSimulationWidget(QWidget):
 
     def load_solvers(self):
         """扫描 solver/ 目录下的子文件夹，每个子文件夹视为一个求解器（含 MInDes.exe）"""
-        if not self.solver_dir.exists():
+        try:
+            dir_mtime = os.stat(self.solver_dir).st_mtime_ns
+        except OSError:
             self.update_status("Error: solver directory not found.", error=True)
             return
 
-        solvers = []
-        for item in self.solver_dir.iterdir():
-            if item.is_dir():
-                exe_path = item / "MInDes.exe"
-                if exe_path.exists():
-                    solvers.append((item.name, str(exe_path.resolve())))
-        solvers.sort(key=lambda x: x[0])
+        # 目录 mtime 未变时直接复用上次扫描结果（增删子目录会改 mtime）
+        cached = self._solver_scan_cache
+        if cached is not None and cached[0] == dir_mtime:
+            solvers = cached[1]
+        else:
+            # os.scandir 的 DirEntry 自带目录类型缓存，每个子目录只需一次
+            # exe 存在性检查，比 iterdir + exists 少一半 stat 调用
+            solvers = []
+            with os.scandir(self.solver_dir) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        exe_path = os.path.join(entry.path, "MInDes.exe")
+                        if os.path.isfile(exe_path):
+                            solvers.append((entry.name, os.path.abspath(exe_path)))
+            solvers.sort(key=operator.itemgetter(0))
+            self._solver_scan_cache = (dir_mtime, solvers)
 
         self.solver_combo.clear()
         for name, path in solvers:
@@ -1042,10 +1420,9 @@ class BuildSimulationWidget(QWidget):
                 info=info,
             )
 
-    def _clear_solver_refs(self):
+    def _on_solver_done(self):
+        """一次运行结束（完成/出错/取消）后的统一收尾，worker 线程保持常驻"""
         self._close_progress_dialog()
-        self.solver_thread = None
-        self.solver_worker = None
         self._solver_shutdown_in_progress = False
         self.cancel_btn.setEnabled(False)
         if self.current_mindes_file:
@@ -1058,11 +1435,12 @@ class BuildSimulationWidget(QWidget):
     def set_mindes_content(self, file_path: str, content: str):
         """由主窗口调用：设置当前 .mindes 文件路径和内容"""
         self.current_mindes_file = os.path.abspath(file_path)
+        self._last_saved_hash = self._content_digest(content)
         self._project_path = Path(self.current_mindes_file).with_suffix("")
         self.is_showing_report = False
         # 确保使用正确的 .mindes 高亮器
         self.switch_highlighter(False)
-        self.text_edit.setPlainText(content)
+        self._set_editor_content(content)
         self._apply_editor_mode()
         self._set_running_state(self.is_running, f"Loaded: {os.path.basename(file_path)}")
         self._update_progress_overlay()
@@ -1072,6 +1450,8 @@ class BuildSimulationWidget(QWidget):
     def _find_progress_stat_file(self):
         if not self._project_path or not self._project_path.exists():
             return None
+        # 延迟导入：log_statistics_widget 顶层会拉起 matplotlib 的 Qt 后端
+        from log_statistics_widget import STAT_CANDIDATES, get_existing_candidates_by_mtime
         stat_candidates = get_existing_candidates_by_mtime(self._project_path, STAT_CANDIDATES)
         return stat_candidates[0] if stat_candidates else None
 
@@ -1174,6 +1554,25 @@ class BuildSimulationWidget(QWidget):
             self.update_status("Terminating solver...", warning=True)
             self.solver_worker.cancel()
 
+    @staticmethod
+    def _write_if_changed(path: Path, content: str):
+        """以 CRLF 落盘；若文件已存在且内容一致则跳过写入
+
+        省掉每次构建前的磁盘写（Windows 下还会触发杀软扫描）。
+        """
+        data = content.replace('\n', '\r\n').encode('utf-8')
+        try:
+            if path.read_bytes() == data:
+                return
+        except OSError:
+            pass
+        # 整块一次 os.write 落盘，绕过缓冲文件对象（内容只有几百字节）
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
     def execute_solver(self, mode: str):
         if not self.current_mindes_file:
             QMessageBox.warning(self, "No File", "Please load a .mindes file first.")
@@ -1184,16 +1583,14 @@ class BuildSimulationWidget(QWidget):
         if self.is_running:
             QMessageBox.information(self, "Busy", "A solver is already running.")
             return  # 防止重复点击
-        if self.solver_worker or self.solver_thread:
-            QMessageBox.information(self, "Busy", "Previous solver resources are still being cleaned up.")
-            return
-        
+
         # 保存 .mindes 文件
         if not self.save_current_content():
             return
         
-        mindes_abs = os.path.abspath(self.current_mindes_file)
-        solver_dir = os.path.dirname(self.selected_solver_path)
+        # 路径只转换一次为 Path 复用，进程边界处再转回 str
+        mindes_abs = str(Path(self.current_mindes_file).resolve())
+        solver_dir = Path(self.selected_solver_path).parent
         omp_threads = max(1, (os.cpu_count() or 2) - 1)
         self._set_running_state(True, f"Launching {mode}...", info=True)
         self._current_run_mode = mode
@@ -1202,15 +1599,11 @@ class BuildSimulationWidget(QWidget):
         cleanup_files = []  # 要在 solver 结束后删除的文件列表
 
         if mode == "build":
-            # 生成 start.in（CRLF）
-            start_in = os.path.join(solver_dir, "start.in")
-            with open(start_in, 'w', newline='\r\n', encoding='utf-8') as f:
-                f.write(mindes_abs + '\n')
-            # 生成 path.in（CRLF）
-            path_in = os.path.join(solver_dir, "path.in")
-            with open(path_in, 'w', newline='\r\n', encoding='utf-8') as f:
-                f.write(mindes_abs + '\n')
-                f.write("-B\n")
+            # 生成 start.in / path.in（CRLF，内容未变时跳过重写）
+            start_in = solver_dir / "start.in"
+            self._write_if_changed(start_in, mindes_abs + '\n')
+            path_in = solver_dir / "path.in"
+            self._write_if_changed(path_in, mindes_abs + '\n' + "-B\n")
             cleanup_files = [start_in, path_in]
             input_base_for_worker = None
             should_cleanup = True
@@ -1227,46 +1620,21 @@ class BuildSimulationWidget(QWidget):
             self._set_running_state(False, f"Unknown mode: {mode}", error=True)
             return
         
-        # === 启动后台线程 ===
-        self.solver_thread = QThread(self)
-        self.solver_worker = SolverRunner(
+        # === 派发到常驻 worker 线程 ===
+        self.solver_worker.configure(
             solver_path=self.selected_solver_path,
             input_base=input_base_for_worker,
-            cwd=solver_dir,
+            cwd=str(solver_dir),
             cleanup_files=cleanup_files if should_cleanup else [],
-            omp_threads=omp_threads
+            omp_threads=omp_threads,
+            affinity_mode="memory" if self.memory_bound_check.isChecked() else "compute"
         )
-        self.solver_worker.moveToThread(self.solver_thread)
-        
-        # 连接信号
-        self.solver_thread.started.connect(self.solver_worker.run)
-        self.solver_worker.started.connect(self.on_solver_started)
-        self.solver_worker.finished.connect(self.on_solver_finished)
-        self.solver_worker.error.connect(self.on_solver_error)
-        self.solver_worker.canceled.connect(self.on_solver_canceled)
-
-        # 清理
-        self.solver_worker.finished.connect(self.solver_thread.quit)
-        self.solver_worker.error.connect(self.solver_thread.quit)
-        self.solver_worker.canceled.connect(self.solver_thread.quit)
-        self.solver_thread.finished.connect(self.solver_worker.deleteLater)
-        self.solver_thread.finished.connect(self.solver_thread.deleteLater)
-        self.solver_thread.finished.connect(self._clear_solver_refs)
-
         self.cancel_btn.setEnabled(True)
-        self.solver_thread.start()
-
-    def on_worker_done(self):
-        """兼容旧接口：统一通过线程 finished 完成清理。"""
-        if self.solver_thread and self.solver_thread.isRunning():
-            self.solver_thread.quit()
-            self.solver_thread.wait(2000)
+        self.requestRunSolver.emit()
 
     def shutdown_solver(self, timeout_ms: int = 5000) -> bool:
         """在主窗口关闭时安全停止后台 solver。"""
         self._close_progress_dialog()
-        if not self.solver_worker or not self.solver_thread:
-            return True
         if self._solver_shutdown_in_progress:
             return False
 
@@ -1284,90 +1652,99 @@ class BuildSimulationWidget(QWidget):
             return False
         return True
 
-    def show_context_menu(self, pos):
-        """右键菜单处理"""
+    def _build_context_menus(self):
+        """预构建两份右键菜单（.mindes 编辑 / report 只读）
+
+        QAction 的创建、分隔符与 triggered 连接只做一次；
+        右键时仅按选区状态切换使能/可见后 exec，避免每次
+        右击都重新分配动作和信号。
+        """
         menu = QMenu(self)
-        cursor = self.text_edit.textCursor()
-        has_selection = not cursor.selectedText().strip() == ""
-        
+        self._act_save = menu.addAction("Save (Ctrl+S)", self.save_current_content)
+        self._act_build = menu.addAction("Build (Ctrl+B)",
+                                         lambda: self.execute_solver(mode="build"))
+        self._act_debug = menu.addAction("Debug Infile (Ctrl+D)",
+                                         self._switch_to_input_report_if_needed)
+        self._act_run = menu.addAction("Run (Ctrl+R)",
+                                       lambda: self.execute_solver(mode="run"))
+        self._act_cancel = menu.addAction("Cancel (Ctrl+E)", self.cancel_solver)
+        menu.addSeparator()
+        self._act_no_selection = menu.addAction("No Selection")
+        self._act_no_selection.setEnabled(False)
+        self._act_copy = menu.addAction("Copy (Ctrl+C)", self.text_edit.copy)
+        self._act_cut = menu.addAction("Cut (Ctrl+X)", self.text_edit.cut)
+        self._act_paste = menu.addAction("Paste (Ctrl+V)", self.text_edit.paste)
+        menu.addSeparator()
+        self._act_custom_def = menu.addAction("Custom Definitions",
+                                              self._on_custom_definitions_action)
+        self._act_input_helper = menu.addAction("Input Helper",
+                                                self._on_input_helper_action)
+        self._edit_menu = menu
+
+        report_menu = QMenu(self)
+        self._act_report_no_selection = report_menu.addAction("No Selection")
+        self._act_report_no_selection.setEnabled(False)
+        self._act_report_copy = report_menu.addAction("Copy", self.text_edit.copy)
+        self._act_report_edit = report_menu.addAction("Edit Infile (Ctrl+D)",
+                                                      self._switch_to_input_report_if_needed)
+        self._report_menu = report_menu
+
+    def _on_custom_definitions_action(self):
+        self._refresh_parsed_definitions()
+        self.show_custom_definitions_popup()
+
+    def _on_input_helper_action(self):
+        # 选区文本与有效性在菜单弹出时已求过一次，直接复用
+        if self._context_sel_text.strip():
+            self._launch_input_helper(self._context_sel_text)
+
+    def show_context_menu(self, pos):
+        """右键菜单处理：菜单已预构建，这里只调整状态后弹出"""
+        selected_text = self.text_edit.textCursor().selectedText()
+        has_selection = bool(selected_text.strip())
+        self._context_sel_text = selected_text
+
         if not self.is_showing_report:
             # 显示 .mindes 文件时的菜单
-            save_action = menu.addAction("Save (Ctrl+S)")
-            Build_action = menu.addAction("Build (Ctrl+B)")
-            read_report_action = menu.addAction("Debug Infile (Ctrl+D)")
-            Run_action = menu.addAction("Run (Ctrl+R)")
-            Cancel_action = menu.addAction("Cancel (Ctrl+E)")
-            menu.addSeparator()
-            if has_selection:
-                copy_action = menu.addAction("Copy (Ctrl+C)")
-                cut_action = menu.addAction("Cut (Ctrl+X)")
-            else:
-                menu.addAction("No Selection").setEnabled(False)
-                copy_action = None
-                cut_action = None
-            paste_action = menu.addAction("Paste (Ctrl+V)")
-            menu.addSeparator()
-            custom_def_action = menu.addAction("Custom Definitions")
-            input_helper_action = menu.addAction("Input Helper")
-            if has_selection:
-                selected_text = cursor.selectedText()
-                if self._is_valid_for_input_helper(selected_text):
-                    input_helper_action.setEnabled(True)
-                else:
-                    input_helper_action.setEnabled(False)
-            else:
-                input_helper_action.setEnabled(False)
-            action = menu.exec(self.text_edit.mapToGlobal(pos))
-            if action == read_report_action:
-                self._switch_to_input_report_if_needed()
-            elif action == save_action:
-                self.save_current_content()
-            elif action == Build_action:
-                self.execute_solver(mode="build")
-            elif action == Run_action:
-                self.execute_solver(mode="run")
-            elif action == Cancel_action:
-                self.cancel_solver()
-            elif action == custom_def_action:
-                self._refresh_parsed_definitions()
-                self.show_custom_definitions_popup()
-            elif action == copy_action:
-                self.text_edit.copy()
-            elif action == cut_action:
-                self.text_edit.cut()
-            elif action == paste_action:
-                self.text_edit.paste()
-            elif action == input_helper_action and has_selection:
-                self._launch_input_helper(cursor.selectedText())
+            self._act_no_selection.setVisible(not has_selection)
+            self._act_copy.setVisible(has_selection)
+            self._act_cut.setVisible(has_selection)
+            self._act_input_helper.setEnabled(
+                has_selection and self._is_valid_for_input_helper(selected_text))
+            self._edit_menu.exec(self.text_edit.mapToGlobal(pos))
         else:
-            if has_selection:
-                copy_action = menu.addAction("Copy")
-                action = menu.exec(self.text_edit.mapToGlobal(pos))
-                if action == copy_action:
-                    self.text_edit.copy()
-            else:
-                menu.addAction("No Selection").setEnabled(False)
-            read_write_action = menu.addAction("Edit Infile (Ctrl+D)")
-            action = menu.exec(self.text_edit.mapToGlobal(pos))
-            if action == read_write_action:
-                self._switch_to_input_report_if_needed()
+            self._act_report_no_selection.setVisible(not has_selection)
+            self._act_report_copy.setVisible(has_selection)
+            self._report_menu.exec(self.text_edit.mapToGlobal(pos))
 
-    def _refresh_parsed_definitions(self):
-        """重新读取 input_report.txt 并更新 self.parsed_definitions"""
+    def _ensure_parsed(self, force: bool = False):
+        """解析（或复用）当前项目的 input_report.txt
+
+        结果挂在 self.parsed_definitions 上并返回；parse_input_report
+        的 stat 缓存保证文件未变时重复调用近乎零成本。force=True 时
+        丢弃缓存条目强制重读（弹窗 Refresh 用）。
+        """
         if not self.current_mindes_file:
             self.parsed_definitions = None
-            return
+            return None
 
         mindes_base = os.path.splitext(self.current_mindes_file)[0]
         report_path = os.path.join(mindes_base, "input_report.txt")
 
         if not os.path.exists(report_path):
             self.parsed_definitions = None
-            return
+            return None
 
+        if force:
+            self._report_parse_cache.pop(report_path, None)
+        self.parsed_definitions = self.parse_input_report(report_path)
+        return self.parsed_definitions
+
+    def _refresh_parsed_definitions(self):
+        """重新读取 input_report.txt 并更新 self.parsed_definitions"""
         try:
-            self.parsed_definitions = self.parse_input_report(report_path)
-            self.update_status("Custom definitions reloaded.", success=True)
+            if self._ensure_parsed() is not None:
+                self.update_status("Custom definitions reloaded.", success=True)
         except Exception as e:
             self.update_status(f"Failed to reload definitions: {e}", error=True)
             self.parsed_definitions = None
@@ -1385,12 +1762,11 @@ class BuildSimulationWidget(QWidget):
         report_path = os.path.join(mindes_base, "input_report.txt")
         if os.path.exists(report_path):
             try:
-                with open(report_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                content = self._read_text_cached(report_path)
                 self.is_showing_report = True
                 # 切换高亮器
                 self.switch_highlighter(True)
-                self.text_edit.setPlainText(content)
+                self._set_editor_content(content)
                 self._apply_editor_mode()
                 self.update_status("Showing input_report.txt (read-only)")
             except Exception as e:
@@ -1398,6 +1774,17 @@ class BuildSimulationWidget(QWidget):
         else:
             self.update_status("input_report.txt not found", warning=True)
 
+    def _read_text_cached(self, path: str) -> str:
+        """按 (mtime_ns, size) 缓存读取文本，来回切换视图时免去重复 IO"""
+        st = os.stat(path)
+        cached = self._file_content_cache.get(path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        self._file_content_cache[path] = (st.st_mtime_ns, st.st_size, content)
+        return content
+
     def _replace_selected_text(self, new_text: str):
         """替换当前选中文本"""
         cursor = self.text_edit.textCursor()
@@ -1409,88 +1796,68 @@ class BuildSimulationWidget(QWidget):
         if not self.current_mindes_file:
             return
         try:
-            with open(self.current_mindes_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self._read_text_cached(self.current_mindes_file)
+            self._last_saved_hash = self._content_digest(content)
             self.is_showing_report = False
             # 切换高亮器
             self.switch_highlighter(False)
-            self.text_edit.setPlainText(content)
+            self._set_editor_content(content)
             self._apply_editor_mode()
             self.update_status(f"Editing: {os.path.basename(self.current_mindes_file)}")
         except Exception as e:
             self.update_status(f"Failed to reload .mindes file: {str(e)}", error=True)
 
     def update_status(self, message: str, error: bool = False, warning: bool = False, success: bool = False, info: bool = False):
-        """更新状态栏消息和颜色"""
+        """更新状态栏消息和颜色
+
+        QSS 字符串为模块级常量（_STATUS_QSS），且仅在状态种类变化时
+        setStyleSheet：求解器运行中每秒可触发多次状态更新，避免 Qt
+        每次重新解析样式表。
+        """
         self.status_line.setText(message)
 
         if error:
-            self.status_line.setStyleSheet("""
-                QLabel {
-                    background-color: #f0f0f0;  /* 淡灰色 */
-                    color: red;
-                    padding: 2px 4px;
-                    border: 1px solid #ccc;
-                    border-radius: 2px;
-                    font-weight: bold;
-                }
-            """)
+            kind = "error"
         elif warning:
-            self.status_line.setStyleSheet("""
-                QLabel {
-                    background-color: #f0f0f0;
-                    color: orange;
-                    padding: 2px 4px;
-                    border: 1px solid #ccc;
-                    border-radius: 2px;
-                    font-weight: bold;
-                }
-            """)
+            kind = "warning"
         elif success:
-            self.status_line.setStyleSheet("""
-                QLabel {
-                    background-color: #f0f0f0;
-                    color: green;
-                    padding: 2px 4px;
-                    border: 1px solid #ccc;
-                    border-radius: 2px;
-                    font-weight: bold;
-                }
-            """)
+            kind = "success"
         elif info:
-            self.status_line.setStyleSheet("""
-                QLabel {
-                    background-color: #f0f0f0;
-                    color: blue;
-                    padding: 2px 4px;
-                    border: 1px solid #ccc;
-                    border-radius: 2px;
-                    font-weight: bold;
-                }
-            """)
+            kind = "info"
         else:
-            self.status_line.setStyleSheet("""
-                QLabel {
-                    background-color: #f0f0f0;
-                    color: gray;
-                    padding: 2px 4px;
-                    border: 1px solid #ccc;
-                    border-radius: 2px;
-                    font-weight: bold;
-                }
-            """)
+            kind = "default"
+        if kind != self._last_status_kind:
+            self.status_line.setStyleSheet(_STATUS_QSS[kind])
+            self._last_status_kind = kind
 
     def get_current_content(self):
         """获取当前文本编辑器的内容"""
         return self.text_edit.toPlainText()
 
+    @staticmethod
+    def _content_digest(content: str) -> bytes:
+        return hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest()
+
     def save_current_content(self):
-        """保存当前内容到 .mindes 文件（如果存在）"""
+        """保存当前内容到 .mindes 文件（如果存在）
+
+        内容与上次落盘一致时直接跳过写入（连续 Ctrl+S 常见）；
+        实际写入先落临时文件再 os.replace 原子替换，避免崩溃留下
+        半截文件。
+        """
         if self.current_mindes_file and not self.is_showing_report:
             try:
                 content = self.get_current_content()
-                with open(self.current_mindes_file, 'w', newline='\n', encoding='utf-8') as f:
+                digest = self._content_digest(content)
+                if digest == self._last_saved_hash:
+                    self.update_status("File already saved (no changes).", success=True)
+                    return True
+                tmp_path = self.current_mindes_file + '.tmp'
+                with open(tmp_path, 'w', newline='\n', encoding='utf-8') as f:
                     f.write(content)
+                os.replace(tmp_path, self.current_mindes_file)
+                self._last_saved_hash = digest
+                self._file_content_cache.pop(self.current_mindes_file, None)
                 self.update_status("File saved successfully.", success=True)
                 return True
             except Exception as e:
@@ -1499,86 +1866,106 @@ class BuildSimulationWidget(QWidget):
         return False
 
     def parse_input_report(self, report_path: str):
-        """增强版解析：通过定位权威区块位置，避免用户输入干扰"""
+        """增强版解析：单次流式扫描按区块收集行，再按固定顺序解析
+
+        标题语义与旧的两阶段实现一致：Macro 取第一个标题，
+        VARIABLE / FUNCTIONS / Parameters 取最后一个标题
+        （后出现的表头直接丢弃先前收集的内容），用户输入无法干扰。
+
+        结果按 (mtime_ns, size) 做 stat 缓存：文件未变时（反复打开
+        Custom Definitions 弹窗等）直接复用上次的解析字典。
+        """
+        st = os.stat(report_path)
+        cached = self._report_parse_cache.get(report_path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        macro_lines = None
+        var_lines = None
+        func_lines = None
+        param_lines = None
+        default_func_line = ""
+
+        mode = None  # 当前收集中的区块
+        skip = 0     # 表头之后需要盲跳的行数（表格区的分隔行）
+
         with open(report_path, 'r', encoding='utf-8') as f:
-            lines = [line.rstrip('\n') for line in f.readlines()]
-
-        # === 第一阶段：扫描所有关键标题的行号 ===
-        macro_first_line = None
-        default_func_first_line = None
-        var_last_line = None
-        func_last_line = None
-        param_last_line = None
-
-        for i, line in enumerate(lines):
-            if "M a c r o" in line and macro_first_line is None:
-                macro_first_line = i
-            if "default functions" in line and default_func_first_line is None:
-                default_func_first_line = i
-            if "NO.\t\tVARIABLE\t|VALUE" in line:
-                var_last_line = i  # 覆盖之前的，保留最后一个
-            if "NO.\t\tFUNCTIONS\t|CONTENT" in line:
-                func_last_line = i
-            if "Parameters Definition" in line:
-                param_last_line = i
+            for raw in f:
+                line = raw.rstrip('\n')
+
+                # --- 标题识别：五个子串探测合并为一次正则扫描 ---
+                m = _REPORT_HEADER_RE.search(line)
+                if m is not None:
+                    kind = m.lastgroup
+                    if kind == 'var':
+                        var_lines = []
+                        mode, skip = 'var', 1
+                        continue
+                    if kind == 'func':
+                        func_lines = []
+                        mode, skip = 'func', 1
+                        continue
+                    if kind == 'param':
+                        param_lines = []
+                        mode, skip = 'param', 0
+                        continue
+                    if kind == 'macro':
+                        if macro_lines is None:
+                            macro_lines = []
+                            mode, skip = 'macro', 0
+                            continue
+                    elif not default_func_line:  # kind == 'deffunc'
+                        default_func_line = line
+
+                # --- 区块内容收集 ---
+                if mode is None:
+                    continue
+                if skip:
+                    skip -= 1
+                    continue
+                if mode == 'param':
+                    # 参数区直到文件末尾，只收 "> ..." 行
+                    stripped = line.strip()
+                    if stripped.startswith('>'):
+                        param_lines.append(stripped)
+                    continue
+                if self._is_section_separator(line):
+                    mode = None
+                    continue
+                if mode == 'macro':
+                    macro_lines.append(line)
+                elif mode == 'var':
+                    var_lines.append(line)
+                else:
+                    func_lines.append(line)
 
         # === 提取内置函数（从第一个 default functions 行）===
-        builtin_funcs = self._extract_builtin_functions_from_line(
-            lines[default_func_first_line] if default_func_first_line is not None else ""
-        )
+        builtin_funcs = self._extract_builtin_functions_from_line(default_func_line)
 
-        # === 初始化结果容器 ===
+        # === 按固定顺序解析收集到的区块 ===
         variables = []
         functions = []
         parameters = []
         macros = []
         func_names = set()
 
-        # === 第二阶段：按区块位置解析 ===
-
-        # ---- 1. Macros (从第一个 "M a c r o" 到下一个分隔线) ----
-        if macro_first_line is not None:
-            i = macro_first_line + 1
-            while i < len(lines) and not self._is_section_separator(lines[i]):
-                self._parse_macro_line(lines[i], macros)
-                i += 1
-
-        # ---- 2. Variables (从最后一个 "VARIABLE" 表头后开始，到分隔线结束) ----
-        if var_last_line is not None:
-            i = var_last_line + 2  # 跳过表头和分隔线（如 "-0| VarName|0.1" 前有一行 "----"）
-            while i < len(lines) and not self._is_section_separator(lines[i]):
-                self._parse_variable_line(lines[i], variables, func_names)
-                i += 1
-
-        # ---- 3. Functions (从最后一个 "FUNCTIONS" 表头后开始) ----
-        if func_last_line is not None:
-            i = func_last_line + 2
-            while i < len(lines) and not self._is_section_separator(lines[i]):
-                self._parse_function_line(lines[i], functions, func_names, builtin_funcs)
-                i += 1
-
-        # ---- 4. Parameters (从最后一个 "Parameters Definition" 后的第一个 "> ..." 行开始) ----
-        if param_last_line is not None:
-            i = param_last_line + 1
-            # 跳过空行和注释，直到遇到以 "> " 开头的行
-            while i < len(lines):
-                stripped = lines[i].strip()
-                if stripped.startswith('>'):
-                    break
-                i += 1
-            # 从该行开始，一直解析到文件结束（参数区无显式结束标记）
-            while i < len(lines):
-                stripped = lines[i].strip()
-                if stripped.startswith('>'):
-                    self._parse_parameter_line(stripped, parameters)
-                i += 1
-
-        return {
+        for line in macro_lines or ():
+            self._parse_macro_line(line, macros)
+        for line in var_lines or ():
+            self._parse_variable_line(line, variables, func_names)
+        for line in func_lines or ():
+            self._parse_function_line(line, functions, func_names, builtin_funcs)
+        for line in param_lines or ():
+            self._parse_parameter_line(line, parameters)
+
+        result = {
             "variables": variables,
             "functions": functions,
             "parameters": parameters,
             "macros": macros
         }
+        self._report_parse_cache[report_path] = (st.st_mtime_ns, st.st_size, result)
+        return result
 
     def _extract_builtin_functions_from_line(self, line: str) -> set:
         """从单行 'default functions : "..."' 中提取函数名"""
@@ -1588,9 +1975,8 @@ class BuildSimulationWidget(QWidget):
         }
         if not line or 'default functions' not in line:
             return default_hardcoded
-        
-        import re
-        matches = re.findall(r'"([^"]+)"', line)
+
+        matches = _QUOTED_RE.findall(line)
         builtin_set = set()
         for match in matches:
             func_name = match.split('(', 1)[0].strip()
@@ -1603,8 +1989,8 @@ class BuildSimulationWidget(QWidget):
         s = line.strip()
         if not s:
             return False
-        # 全是 = 或 -（允许中间有空格？但通常没有）
-        if all(c == '=' for c in s) or all(c == '-' for c in s):
+        # 全是 = 或 -：strip 掉该字符后为空（C 实现，替代逐字符循环）
+        if not s.strip('=') or not s.strip('-'):
             return True
         # 或以多个 = / - 开头（如 debug 分隔线）
         if s.startswith('===') or s.startswith('---'):
@@ -1612,39 +1998,45 @@ class BuildSimulationWidget(QWidget):
         return False
 
     def _parse_function_line(self, line: str, functions: list, func_names: set, builtin_funcs: set):
-        parts = [p.strip().replace('\t', ' ') for p in line.split('|')]
-        parts = [p for p in parts if p]
-        if len(parts) >= 3:
-            no_str, name, expr = parts[0], parts[1], parts[2]
-            if no_str.isdigit():
-                no = int(no_str)
-                if name not in builtin_funcs:
-                    cleaned_expr = self.clean_function_expression(expr)
-                    functions.append({"no": no, "name": name, "expr": cleaned_expr})
-                    func_names.add(name)
+        # partition 逐段切分：不建中间列表，序号非数字的行在第一段就被拒掉
+        no_str, _, rest = line.strip().strip('|').partition('|')
+        no_str = no_str.strip()
+        if no_str.isdigit():
+            no = int(no_str)
+            name, sep, expr = rest.partition('|')
+            if not sep:
+                return
+            name = name.strip().replace('\t', ' ')
+            if name not in builtin_funcs:
+                # 第二个 | 之后整段是表达式，内含 | 也不会被截断
+                expr = expr.strip().replace('\t', ' ')
+                cleaned_expr = self.clean_function_expression(expr)
+                functions.append(Function(no, name, cleaned_expr))
+                func_names.add(name)
 
     def _parse_variable_line(self, line: str, variables: list, func_names: set):
-        parts = [p.strip().replace('\t', ' ') for p in line.split('|')]
-        parts = [p for p in parts if p]
-        if len(parts) >= 3:
-            no_str, name, value = parts[0], parts[1], parts[2]
-            if no_str.isdigit():
-                no = int(no_str)
-                # 跳过纯数字名 和 已知函数名
-                if not name.isdigit() and name not in func_names:
-                    variables.append({"no": no, "name": name, "value": value})
+        no_str, _, rest = line.strip().strip('|').partition('|')
+        no_str = no_str.strip()
+        if no_str.isdigit():
+            no = int(no_str)
+            name, sep, value = rest.partition('|')
+            if not sep:
+                return
+            name = name.strip().replace('\t', ' ')
+            # 跳过纯数字名 和 已知函数名
+            if not name.isdigit() and name not in func_names:
+                variables.append(Variable(no, name, value.strip().replace('\t', ' ')))
 
     def _parse_parameter_line(self, line: str, parameters: list):
-        import re
-        match = re.match(r'>\s*\[([^\]]+)\]\s*([^=]+?)\s*=\s*(.+)', line)
+        match = _PARAM_RE.match(line)
         if match:
             tag, name, value = match.groups()
             name = name.strip()
             value = value.strip()
             # 跳过带索引的参数名，如 a(1), b[2], c{3}
-            if re.search(r'[\(\[\{]\d+[\)\]\}]$', name) or re.search(r'\w+\(\d+\)$', name):
+            if _PARAM_IDX_RE.search(name) or _PARAM_CALL_RE.search(name):
                 return
-            parameters.append({"tag": tag, "name": name, "value": value})
+            parameters.append(Parameter(tag, name, value))
 
     def _parse_macro_line(self, line: str, macros: list):
         """
@@ -1653,59 +2045,81 @@ class BuildSimulationWidget(QWidget):
           '1.tube , $TUBE[1,10,2]$ = 1,3,5,7,9'
           '2.rand , $RAND_INT[1,10]$ = 1 - 10 , $RAND_REAL[1,10]$ = 1.000000 - 10.000000'
         """
-        import re
-
-        # 移除行首编号（如 "1.", "2."）
-        line = re.sub(r'^\d+\.\w*\s*,?\s*', '', line)
-
         # 分割逗号，但注意值中可能含逗号（如 "1,3,5"），所以不能简单 split(',')
-        # 改为：用正则匹配所有 $NAME[...]$ = value 模式
+        # 改为：用正则匹配所有 $NAME[...]$ = value 模式（_MACRO_DEF_RE）
         # 注意：value 可能包含空格、连字符、数字、小数等
-
-        # 先找出所有 $...$ 部分
-        macro_pattern = r'\$([A-Za-z_]\w*)$$([^$$]*)\$\s*=\s*(.*?)(?=\s*,\s*\$|$)'
         # 解释：
-        # - \$([A-Za-z_]\w*)$$([^$$]*)\$  → 捕获 NAME 和 [...]（不含 $）
+        # - \$([A-Za-z_]\w*)(\[[^\]]*\])\$ → 捕获 NAME 和 [...]（含方括号）
         # - \s*=\s*                        → 等号
         # - (.*?)                          → 非贪婪捕获值
         # - (?=\s*,\s*\$|$)               → 后瞻：直到下一个 ", $" 或行尾
+        # 行首编号（如 "1.tube ,"）不匹配该模式，无需预先剥除。
+
+        for name, signature, value in _MACRO_DEF_RE.findall(line):
+            macros.append(Macro(name, signature, value.strip()))  # signature 如 "[1,10,2]"
 
-        matches = re.findall(macro_pattern, line)
-        for name, signature, value in matches:
-            macros.append({
-                "name": name,
-                "signature": signature,      # 如 "[1,10,2]"
-                "value": value.strip()
-            })
+    def _set_editor_content(self, content: str):
+        """装载大文本：先摘除高亮器，下一轮事件循环再挂回
+
+        setPlainText 挂着高亮器时会同步重高亮整个文档；摘掉后文本
+        先以普通样式绘制出来，完整高亮推迟到界面响应之后再做。
+        """
+        hl = self.current_highlighter
+        if hl is not None:
+            hl.setDocument(None)
+        # 大文档装载期间停掉视口刷新，让布局一次性完成后再重绘
+        self.text_edit.setUpdatesEnabled(False)
+        try:
+            self.text_edit.setPlainText(content)
+        finally:
+            self.text_edit.setUpdatesEnabled(True)
+        if hl is not None:
+            def _reattach():
+                # 期间若已切换高亮器，由切换逻辑负责挂接
+                if self.current_highlighter is hl:
+                    hl.setDocument(self.text_edit.document())
+            QTimer.singleShot(0, _reattach)
 
     def switch_highlighter(self, is_report_file: bool):
-        """切换语法高亮器
-        
+        """切换语法高亮器（合并到下一轮事件循环统一执行）
+
+        setDocument 会触发整篇文档的重高亮；同一事件循环内的
+        往返切换只保留最后一次请求，实际挂接推迟到
+        _apply_pending_highlighter，避免连续两次全量高亮。
+
         Args:
             is_report_file: True 表示切换到 report 高亮器，False 表示切换到 mindes 高亮器
         """
-        if is_report_file:
-            if self.current_highlighter != self.report_highlighter:
-                # 切换到报告高亮器
-                if self.mindes_highlighter is not None:
-                    self.mindes_highlighter.setDocument(None)
-                if self.report_highlighter is not None:
-                    self.report_highlighter.setDocument(self.text_edit.document())
+        self._pending_highlighter_is_report = is_report_file
+        if not self._highlighter_switch_scheduled:
+            self._highlighter_switch_scheduled = True
+            QTimer.singleShot(0, self._apply_pending_highlighter)
+
+    def _apply_pending_highlighter(self):
+        """执行最近一次 switch_highlighter 请求的实际切换"""
+        self._highlighter_switch_scheduled = False
+        if self._pending_highlighter_is_report:
+            if self.report_highlighter is None:
+                # 延迟构建：构造时即挂接文档并完成首次高亮
+                self.report_highlighter = ReportSyntaxHighlighter(self.text_edit.document())
                 self.current_highlighter = self.report_highlighter
+                return
+            target = self.report_highlighter
         else:
-            if self.current_highlighter != self.mindes_highlighter:
-                # 切换到 .mindes 高亮器
-                if self.report_highlighter is not None:
-                    self.report_highlighter.setDocument(None)
-                if self.mindes_highlighter is not None:
-                    self.mindes_highlighter.setDocument(self.text_edit.document())
-                self.current_highlighter = self.mindes_highlighter
+            target = self.mindes_highlighter
+        if self.current_highlighter is target:
+            return
+        if self.current_highlighter is not None:
+            self.current_highlighter.setDocument(None)
+        if target is not None:
+            target.setDocument(self.text_edit.document())
+        self.current_highlighter = target
 
     def _build_merged_definitions_data(self, variables, functions):
         """
         将变量列表和函数列表按名称合并，生成用于表格显示的统一数据列表。
         
-        返回: List[Dict]，每个 dict 包含:
+        返回: List[_DefRow]，字段:
             - no: int
             - name: str
             - expression: str ('-' if no function)
@@ -1713,65 +2127,39 @@ class BuildSimulationWidget(QWidget):
             - has_var: bool
             - has_func: bool
         """
+        # 变量和函数在 parse_input_report 中均按 no 升序产出，
+        # 双指针归并即可直接得到有序列表，免去最后的 lambda 排序。
         name_map = {}
-
-        # 处理变量
-        for var in variables:
-            name = var["name"]
-            name_map[name] = {
-                "no": var["no"],
-                "name": name,
-                "expression": "-",
-                "value": var["value"],
-                "has_var": True,
-                "has_func": False
-            }
-
-        # 处理函数（可能与变量同名）
-        for func in functions:
-            name = func["name"]
-            if name in name_map:
-                # 同名：补充表达式
-                name_map[name]["expression"] = func["expr"]
-                name_map[name]["has_func"] = True
+        ordered = []
+        vi, fi = 0, 0
+        nv, nf = len(variables), len(functions)
+        while vi < nv or fi < nf:
+            take_var = fi >= nf or (vi < nv and variables[vi].no <= functions[fi].no)
+            if take_var:
+                var = variables[vi]
+                vi += 1
+                entry = name_map.get(var.name)
+                if entry is not None:
+                    # 同名函数已先入列：就地补充变量值
+                    entry.value = var.value
+                    entry.has_var = True
+                else:
+                    entry = _DefRow(var.no, var.name, "-", var.value, True, False)
+                    name_map[var.name] = entry
+                    ordered.append(entry)
             else:
-                # 纯函数
-                name_map[name] = {
-                    "no": func["no"],
-                    "name": name,
-                    "expression": func["expr"],
-                    "value": "-",
-                    "has_var": False,
-                    "has_func": True
-                }
-
-        # 转为列表并排序
-        all_items = list(name_map.values())
-        all_items.sort(key=lambda x: x["no"])
-        return all_items
-
-    def _populate_definition_table(self, table: QTableWidget, items: list):
-        """
-        将合并后的定义项列表填充到 QTableWidget 中。
-        
-        :param table: 目标表格控件
-        :param items: 来自 _build_merged_definitions_data 的列表
-        """
-        table.setRowCount(len(items))
-        for row, item in enumerate(items):
-            name_item = QTableWidgetItem(item["name"])
-            # 仅纯函数名称加粗（变量或合并项不加粗）
-            if item["has_func"] and not item["has_var"]:
-                font = name_item.font()
-                font.setBold(True)
-                name_item.setFont(font)
-            elif item["has_func"] and item["has_var"]:
-                font = name_item.font()
-                font.setBold(True)
-                name_item.setFont(font)
-            table.setItem(row, 0, name_item)
-            table.setItem(row, 1, QTableWidgetItem(item["value"]))
-            table.setItem(row, 2, QTableWidgetItem(item["expression"]))
+                func = functions[fi]
+                fi += 1
+                entry = name_map.get(func.name)
+                if entry is not None:
+                    # 同名变量已先入列：就地补充表达式
+                    entry.expression = func.expr
+                    entry.has_func = True
+                else:
+                    entry = _DefRow(func.no, func.name, func.expr, "-", False, True)
+                    name_map[func.name] = entry
+                    ordered.append(entry)
+        return ordered
 
     def show_custom_definitions_popup(self):
         variables = self.parsed_definitions.get("variables", []) if self.parsed_definitions else []
@@ -1787,18 +2175,15 @@ class BuildSimulationWidget(QWidget):
         popup.resize(500, 400)
         layout = QVBoxLayout(popup)
 
-        # 创建表格
-        table = QTableWidget()
-        table.setColumnCount(3)
-        table.setHorizontalHeaderLabels(["Name", "Value", "Expression"])
-        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectItems)  # 允许选中单个单元格
+        # 创建表格（model/view：单元格按需取数，不逐行建 item）
+        table = QTableView()
+        table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        table.setSelectionBehavior(QTableView.SelectionBehavior.SelectItems)  # 允许选中单个单元格
         table.setSortingEnabled(True)
 
         all_items = self._build_merged_definitions_data(variables, functions)
-        all_items.sort(key=lambda x: x["no"])
-
-        self._populate_definition_table(table, all_items)
+        model = DefinitionsTableModel(all_items, table)
+        table.setModel(model)
 
         # === 列宽调整策略 ===
         header = table.horizontalHeader()
@@ -1808,7 +2193,7 @@ class BuildSimulationWidget(QWidget):
 
         # 存储引用，用于刷新（使用 setattr 以避免类型检查错误）
         setattr(popup, 'table', table)
-        setattr(popup, 'all_items', all_items)  # 初始数据（仅用于类型判断，实际刷新会重载）
+        setattr(popup, 'model', model)
 
         # === 右键菜单 ===
         def show_context_menu(pos):
@@ -1818,9 +2203,9 @@ class BuildSimulationWidget(QWidget):
 
             action = context_menu.exec(table.viewport().mapToGlobal(pos))
             if action == copy_action:
-                selected = table.selectedItems()
+                selected = table.selectionModel().selectedIndexes()
                 if selected:
-                    text = selected[0].text()
+                    text = str(selected[0].data() or "")
                     QApplication.clipboard().setText(text)
             elif action == refresh_action:
                 self._refresh_custom_definitions_table(popup)
@@ -1839,75 +2224,34 @@ class BuildSimulationWidget(QWidget):
 
     def _refresh_custom_definitions_table(self, popup_widget):
         """刷新弹窗中的表格内容，并保持与主弹窗一致的合并逻辑"""
-        if self.current_mindes_file is not None:
-            mindes_base = os.path.splitext(self.current_mindes_file)[0]
-        else:
-            print("current_mindes_file lost")
-        report_path = os.path.join(mindes_base, "input_report.txt")
-
-        if not os.path.exists(report_path):
-            QMessageBox.warning(popup_widget, "Refresh Failed", "input_report.txt not found.")
-            return
-
         try:
-            new_parsed = self.parse_input_report(report_path)
+            new_parsed = self._ensure_parsed(force=True)
+            if new_parsed is None:
+                QMessageBox.warning(popup_widget, "Refresh Failed", "input_report.txt not found.")
+                return
             variables = new_parsed.get("variables", [])
             functions = new_parsed.get("functions", [])
 
             all_items = self._build_merged_definitions_data(variables, functions)
-            all_items.sort(key=lambda x: x["no"])
 
-            # 清空并重填表格
-            if hasattr(popup_widget,"table"):
-                table = popup_widget.table
+            # 整表换数据，不重建单元格
+            if hasattr(popup_widget, "model"):
+                popup_widget.model.set_items(all_items)
             else:
-                print("popup widget doesn't has attribute 'table'")
-                return 
-            
-            self._populate_definition_table(table, all_items)
+                print("popup widget doesn't has attribute 'model'")
+                return
 
-            # 关键：同步主状态，确保下次打开弹窗也是最新合并数据
-            self.parsed_definitions = new_parsed
+            # 主状态已由 _ensure_parsed 同步，下次打开弹窗即最新数据
             self.update_status("Custom Definitions refreshed.", success=True)
 
         except Exception as e:
             QMessageBox.critical(popup_widget, "Refresh Error", f"Failed to refresh: {str(e)}")
             self.update_status(f"Refresh failed: {e}", error=True)
 
-    def clean_function_expression(self, expr: str) -> str:
-        """
-        清理函数表达式中的调试标记
-        示例:
-          输入: '+{+[(VarName)*pow(VarName,2)]}'
-          输出: 'VarName * pow(VarName, 2)'
-        """
-        s = expr.strip()
-        if not s:
-            return expr
-
-        # 移除最外层的 { } 或 [ ]（递归移除）
-        while (s.startswith('{') and s.endswith('}')) or (s.startswith('[') and s.endswith(']')):
-            s = s[1:-1].strip()
-
-        # 移除所有前导 '+'（包括 "+(" 和 "+Var"）
-        import re
-        # 处理 "+(...)" → "(...)"
-        s = re.sub(r'\+\s*\(', '(', s)
-        # 处理 "+变量" → "变量"
-        s = re.sub(r'\+\s*([a-zA-Z_]\w*)', r'\1', s)
-        # 处理 "+数字" → "数字"
-        s = re.sub(r'\+\s*(\d+(?:\.\d+)?)', r'\1', s)
-        # 移除孤立的 '+'（如结尾）
-        s = re.sub(r'\+\s*', ' ', s)
-
-        # 可选：美化运算符（增加空格）
-        s = re.sub(r'(\w)\*', r'\1 * ', s)
-        s = re.sub(r'\*(\w)', r' * \1', s)
-
-        # 合并多余空格
-        s = re.sub(r'\s+', ' ', s).strip()
-
-        return s if s else expr
+    @staticmethod
+    def clean_function_expression(expr: str) -> str:
+        """清理函数表达式中的调试标记（带 lru_cache 的模块级实现）"""
+        return _clean_function_expression(expr)
 ###################################################################################
 # INPUT HELPER MANAGER
     def _is_valid_for_input_helper(self, text: str) -> bool:
@@ -1926,9 +2270,9 @@ class BuildSimulationWidget(QWidget):
 #----------------------------------------------------------------------------------
     def _is_tuple_pattern(self, text: str) -> bool:
         # 匹配 (a, b, c) 形式的元组
-        return re.fullmatch(r'\([^)]+\)', text.strip()) is not None
-    def _show_tuple_helper(self, current_text: str):
-        """辅助生成元组 (a, b, c)"""
+        return _TUPLE_FULL_RE.fullmatch(text.strip()) is not None
+    def _build_tuple_helper_dialog(self) -> QDialog:
+        """构建 Tuple Helper 弹窗（每个实例只建一次，重复使用）"""
         dialog = QDialog(self)
         dialog.setWindowTitle("Tuple Helper")
         layout = QVBoxLayout(dialog)
@@ -1937,21 +2281,32 @@ class BuildSimulationWidget(QWidget):
         layout.addWidget(label)
 
         text_edit = QTextEdit()
-        # 解析当前值（如 "(1, 2, 3)" → ["1", "2", "3"]）
-        inner = current_text.strip()[1:-1] if len(current_text) > 2 else ""
-        items = [x.strip() for x in inner.split(',')] if inner else []
-        text_edit.setPlainText('\n'.join(items))
         layout.addWidget(text_edit)
+        setattr(dialog, 'text_edit', text_edit)
 
         btn_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
         btn_box.accepted.connect(dialog.accept)
         btn_box.rejected.connect(dialog.reject)
         layout.addWidget(btn_box)
+        return dialog
+
+    def _show_tuple_helper(self, current_text: str):
+        """辅助生成元组 (a, b, c)"""
+        if self._tuple_helper_dialog is None:
+            self._tuple_helper_dialog = self._build_tuple_helper_dialog()
+        dialog = self._tuple_helper_dialog
+        text_edit = dialog.text_edit
+
+        # 解析当前值（如 "(1, 2, 3)" → ["1", "2", "3"]）
+        inner = current_text.strip()[1:-1] if len(current_text) > 2 else ""
+        items = [x.strip() for x in inner.split(',')] if inner else []
+        text_edit.setPlainText('\n'.join(items))
 
         if dialog.exec() == QDialog.DialogCode.Accepted:
             lines = text_edit.toPlainText().splitlines()
             new_tuple = "(" + ", ".join(line.strip() for line in lines if line.strip()) + ")"
             self._replace_selected_text(new_tuple)
+        text_edit.clear()
 
 ###################################################################################
 
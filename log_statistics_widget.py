@@ -10,10 +10,12 @@ from PySide6.QtWidgets import (
     QLabel, QPushButton, QFileDialog, QMenu, QMessageBox, QSizePolicy
 )
 from PySide6.QtCore import Qt, Signal, QFileSystemWatcher, QTimer
-from PySide6.QtGui import QFont, QKeySequence, QShortcut
+from PySide6.QtGui import QFont, QKeySequence, QShortcut, QFontDatabase
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
+from status_level import StatusLevel
+
 # === 定义候选文件名（按优先级排序，高 → 低）===
 LOG_CANDIDATES = ["Log.txt", "log.txt"]
 STAT_CANDIDATES = ["Statistics.txt", "data_statistics.txt"]
@@ -60,8 +62,8 @@ class LogStatisticsWidget(QWidget):
     - 状态消息通过信号发出，供主窗口状态栏显示
     """
 
-    # 状态信号：(message, level) 其中 level in {"info", "warning", "error"}
-    statusMessage = Signal(str, str)
+    # 状态信号：(message, level) 其中 level 为 StatusLevel 整数值
+    statusMessage = Signal(str, int)
 
     def __init__(self, parent=None, progress_callback=None):
         super().__init__(parent)
@@ -104,7 +106,7 @@ class LogStatisticsWidget(QWidget):
         """由主窗口调用：设置当前 .mindes 文件路径，自动推导结果目录"""
         if not project_folder:
             self._project_path = None
-            self.statusMessage.emit("Project path cleared.", "info")
+            self.statusMessage.emit("Project path cleared.", StatusLevel.INFO)
             # 可选：清空 UI
             self.log_edit.setPlainText("(No valid project path)")
             self.stat_edit.setPlainText("(No valid project path)")
@@ -125,7 +127,7 @@ class LogStatisticsWidget(QWidget):
             self.stat_edit.setPlainText("(Result directory not created yet)")
             self.data_df = None
             self.update_combo_boxes()
-            self.statusMessage.emit(f"Waiting for result dir: {self._project_path.name}", "info")
+            self.statusMessage.emit(f"Waiting for result dir: {self._project_path.name}", StatusLevel.INFO)
             return
         # 尝试加载
         self.load_log_and_statistics()
@@ -283,7 +285,7 @@ class LogStatisticsWidget(QWidget):
     def export_to_excel(self):
         """将当前 data_df 导出为 Excel 文件"""
         if self.data_df is None or self.data_df.empty:
-            self.statusMessage.emit("No data to export.", "warning")
+            self.statusMessage.emit("No data to export.", StatusLevel.WARNING)
             QMessageBox.warning(self, "Export Error", "No data available to export.")
             return
 
@@ -304,18 +306,27 @@ class LogStatisticsWidget(QWidget):
                 if not file_path.lower().endswith('.csv'):
                     file_path += '.csv'
                 self.data_df.to_csv(file_path, index=False)
-            self.statusMessage.emit(f"Data exported: {os.path.basename(file_path)}", "info")
+            self.statusMessage.emit(f"Data exported: {os.path.basename(file_path)}", StatusLevel.INFO)
         except Exception as e:
-            self.statusMessage.emit(f"Export failed: {e}", "error")
+            self.statusMessage.emit(f"Export failed: {e}", StatusLevel.ERROR)
             QMessageBox.critical(self, "Export Error", f"Failed to export data:\n{e}")
 
+    # 查一次字体库后缓存的等宽字体族名，所有实例共用
+    _MONO_FAMILY = None
+
+    @classmethod
+    def _pick_mono_family(cls):
+        if cls._MONO_FAMILY is None:
+            available = set(QFontDatabase.families())
+            cls._MONO_FAMILY = next(
+                (f for f in ("Consolas", "Courier New", "Monaco", "DejaVu Sans Mono")
+                 if f in available),
+                "monospace"
+            )
+        return cls._MONO_FAMILY
+
     def _get_monospace_font(self):
-        font = QFont()
-        families = ["Consolas", "Courier New", "Monaco", "DejaVu Sans Mono", "monospace"]
-        for family in families:
-            font.setFamily(family)
-            if font.family() == family:
-                break
+        font = QFont(self._pick_mono_family())
         font.setPointSize(9)
         return font
 
@@ -349,7 +360,7 @@ class LogStatisticsWidget(QWidget):
                 loaded_log_path = path
                 break
             except Exception as e:
-                self.statusMessage.emit(f"Failed to read {path.name}: {e}", "error")
+                self.statusMessage.emit(f"Failed to read {path.name}: {e}", StatusLevel.ERROR)
                 continue
 
         self.log_edit.setPlainText(log_content)
@@ -374,7 +385,7 @@ class LogStatisticsWidget(QWidget):
                 if parsed_df is not None:
                     break
             except Exception as e:
-                self.statusMessage.emit(f"Failed to read or parse {path.name}: {e}", "error")
+                self.statusMessage.emit(f"Failed to read or parse {path.name}: {e}", StatusLevel.ERROR)
                 continue
 
         self.stat_edit.setPlainText(stat_content)
@@ -404,15 +415,15 @@ class LogStatisticsWidget(QWidget):
             base_msg = f"Data loaded from: {self._project_path.name}"
             if msg_parts:
                 base_msg += " (" + ", ".join(msg_parts) + ")"
-            self.statusMessage.emit(base_msg, "info")
+            self.statusMessage.emit(base_msg, StatusLevel.INFO)
         else:
-            self.statusMessage.emit(f"No output files found in: {self._project_path.name}", "warning")
+            self.statusMessage.emit(f"No output files found in: {self._project_path.name}", StatusLevel.WARNING)
 
     def _on_file_changed(self, path: str):
         """当被监视的文件（Log.txt / Statistics.txt）发生变化时触发"""
         from pathlib import Path
         file_name = Path(path).name
-        self.statusMessage.emit(f"Detected change in {file_name}, update queued...", "info")
+        self.statusMessage.emit(f"Detected change in {file_name}, update queued...", StatusLevel.INFO)
         self._refresh_dirty = True
         if not self._refresh_timer.isActive():
             self._refresh_timer.start()
@@ -444,7 +455,7 @@ class LogStatisticsWidget(QWidget):
             if not df.empty and len(df.columns) >= 1:
                 return df
         except Exception as e:
-            self.statusMessage.emit(f"Primary parsing failed: {e}", "warning")
+            self.statusMessage.emit(f"Primary parsing failed: {e}", StatusLevel.WARNING)
 
         # === Fallback: only if main fails ===
         return None
@@ -461,9 +472,9 @@ class LogStatisticsWidget(QWidget):
             self.log_edit.setPlainText(f"(Data loaded from: {os.path.basename(file_path)})")
             self.stat_edit.setPlainText("(Excel mode – no text display)")
             self._stage_figure_dataframe(loaded_df, force=True)
-            self.statusMessage.emit(f"Loaded Excel: {os.path.basename(file_path)}", "info")
+            self.statusMessage.emit(f"Loaded Excel: {os.path.basename(file_path)}", StatusLevel.INFO)
         except Exception as e:
-            self.statusMessage.emit(f"Failed to load Excel: {e}", "error")
+            self.statusMessage.emit(f"Failed to load Excel: {e}", StatusLevel.ERROR)
             QMessageBox.critical(self, "Load Error", f"Failed to load Excel:\n{e}")
 
     def update_combo_boxes(self):
@@ -552,7 +563,7 @@ class LogStatisticsWidget(QWidget):
 
     def save_plot(self):
         if not hasattr(self, 'plot_figure') or not self.plot_figure.axes:
-            self.statusMessage.emit("No figure to save.", "warning")
+            self.statusMessage.emit("No figure to save.", StatusLevel.WARNING)
             return
 
         file_path, selected_filter = QFileDialog.getSaveFileName(
@@ -576,9 +587,9 @@ class LogStatisticsWidget(QWidget):
 
         try:
             self.plot_figure.savefig(file_path, dpi=300, bbox_inches="tight")
-            self.statusMessage.emit(f"Figure saved: {os.path.basename(file_path)}", "info")
+            self.statusMessage.emit(f"Figure saved: {os.path.basename(file_path)}", StatusLevel.INFO)
         except Exception as e:
-            self.statusMessage.emit(f"Failed to save figure: {e}", "error")
+            self.statusMessage.emit(f"Failed to save figure: {e}", StatusLevel.ERROR)
             QMessageBox.critical(self, "Save Error", f"Failed to save figure:\n{e}")
 
     def show_plot_context_menu(self, pos):
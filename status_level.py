@@ -0,0 +1,15 @@
+# status_level.py
+from enum import IntEnum
+
+
+class StatusLevel(IntEnum):
+    """状态消息级别。
+
+    以整数穿越 Qt 信号边界（Signal(str, int)），接收端可直接用
+    级别值做列表索引，避免每条消息的字符串比较。
+    """
+
+    INFO = 0
+    SUCCESS = 1
+    WARNING = 2
+    ERROR = 3